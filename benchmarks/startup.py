@@ -0,0 +1,93 @@
+"""startup-time benchmark of the CLI entry points
+
+Measures the wall-clock time of `<entry point> --help` (interpreter startup,
+imports and argument parsing, but no actual work), along with the modules
+of the package each entry point imports.
+
+usage: python benchmarks/startup.py [-n RUNS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+ENTRY_POINTS = {
+    "python": None,  # bare interpreter startup, for reference
+    "geneticalgorithm": "geneticalgorithm",
+    "experiment": "geneticalgorithm.experiment",
+    "decrypt": "geneticalgorithm.decrypt",
+}
+
+# prints the package modules imported by an entry point
+LIST_MODULES = """
+import runpy, sys
+sys.argv = [sys.argv[1], "--help"]
+try:
+    runpy.run_module(sys.argv[0], run_name="__main__")
+except SystemExit:
+    pass
+print(" ".join(sorted(m for m in sys.modules if m.startswith("geneticalgorithm"))), file=sys.stderr)
+"""
+
+parser = argparse.ArgumentParser(
+    prog="Startup Benchmark", description="measures startup time of the CLIs"
+)
+parser.add_argument(
+    "-n",
+    "--runs",
+    dest="runs",
+    help="Number of runs per entry point [default: 20]",
+    type=int,
+    default=20,
+)
+
+
+def command(module: str | None) -> list[str]:
+    if module is None:
+        return [sys.executable, "-c", "pass"]
+    return [sys.executable, "-m", module, "--help"]
+
+
+def measure(module: str | None, runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command(module), stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def imported_modules(module: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", LIST_MODULES, module],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return result.stderr.strip().splitlines()[-1]
+
+
+def main() -> int:
+    args = parser.parse_args()
+
+    print(f"{'entry point':<18} {'min (ms)':>9} {'median (ms)':>12}")
+    for name, module in ENTRY_POINTS.items():
+        times = measure(module, args.runs)
+        print(
+            f"{name:<18} {min(times) * 1000:>9.1f} "
+            f"{statistics.median(times) * 1000:>12.1f}"
+        )
+
+    print()
+    for name, module in ENTRY_POINTS.items():
+        if module is not None:
+            print(f"{name}: {imported_modules(module)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,19 @@
+import heapq
+import time
+from collections import Counter
 from collections.abc import Generator
 from string import ascii_lowercase
 from random import Random
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from .mutations import Mutation
-from .crossovers import Crossover
-from .selections import Selection
-from .evaluators import Evaluator
+if TYPE_CHECKING:
+    # only needed for annotations, keeps `import geneticalgorithm` cheap
+    from .mutations import Mutation
+    from .crossovers import Crossover
+    from .selections import Selection
+    from .evaluators import Evaluator
+    from .executors import EvaluationExecutor
 
 
 ALLELES = tuple(ascii_lowercase + "-")  # a-z and special "-" character
@@ -19,16 +26,71 @@ class Parameters:
     max_generation_span: int
     crossover_rate: float
     mutation_rate: float
+    # multi-fidelity evaluation: the first generation is scored on a prefix
+    # of `sample_fraction` of the cipher text, growing linearly to the full
+    # text over `sample_ramp` generations
+    sample_fraction: float = 1.0
+    sample_ramp: int = 0
+    # number of best candidates re-scored on the full text each generation
+    full_evaluations: int = 2
+    # optional budgets, checked between generations
+    max_evaluations: int | None = None
+    max_seconds: float | None = None
+    # replace duplicate chromosomes each generation with immigrants:
+    # "random" chromosomes or mutants of "elite" chromosomes (None: keep duplicates)
+    immigrants: str | None = None
+    # offspring produced (and evaluated) per step of the steady-state GA
+    offspring: int = 2
+
+    def __post_init__(self):
+        if not 0.0 < self.sample_fraction <= 1.0:
+            raise ValueError(
+                f"sample_fraction must be in (0, 1], not {self.sample_fraction}"
+            )
+
+    def sample_size(self, gen: int) -> float:
+        """fraction of the cipher text used to evaluate generation `gen`"""
+        if gen > self.sample_ramp:
+            return 1.0
+        progress = (gen - 1) / self.sample_ramp
+        return self.sample_fraction + (1.0 - self.sample_fraction) * progress
+
+
+@dataclass
+class RunStats:
+    """counters updated by `genetic_algorithm` as it runs"""
+
+    evaluations: int = 0  # calls to the fitness function
+    cache_hits: int = 0  # fitness values reused instead of evaluated
+    elapsed: float = 0.0  # seconds spent inside the genetic algorithm
+    duplicates: int = 0  # duplicate chromosomes found
+    immigrants: int = 0  # duplicates replaced by immigrants
+
+    @property
+    def evaluations_per_second(self) -> float:
+        return self.evaluations / self.elapsed if self.elapsed > 0 else 0.0
+
+    def exhausted(self, params: Parameters) -> bool:
+        """whether the evaluation or time budget of the parameters is used up"""
+        return (
+            params.max_evaluations is not None
+            and self.evaluations >= params.max_evaluations
+        ) or (params.max_seconds is not None and self.elapsed >= params.max_seconds)
 
 
 def genetic_algorithm(
     params: Parameters,
-    crossover: Crossover,
+    crossover: "Crossover",
     *,
-    mutation: Mutation,
-    selection: Selection,
-    fitness: Evaluator,
+    mutation: "Mutation",
+    selection: "Selection",
+    fitness: "Evaluator",
     rng: Random,
+    executor: "EvaluationExecutor | None" = None,
+    stats: RunStats | None = None,
+    population: list[str] | None = None,
+    start_generation: int = 1,
+    cache: dict[str, float] | None = None,
 ) -> Generator[dict[str, float], None, None]:
     """implementation of the genetic algorithm
     it takes the parameters as input, along with implementations
@@ -36,17 +98,50 @@ def genetic_algorithm(
 
     The result is an iterator that yields the list of fitness values for each generation,
     allowing the calling the code to access the fitness values during each generation.
+
+    Fitness values are computed in the calling process unless an `executor`
+    is provided to spread them across worker processes.
+
+    The run stops early once the evaluation or time budget of the parameters
+    is exhausted. Progress is counted in `stats`, if provided.
+
+    A run can start from a given `population` instead of a random one.
+    That list is updated in place: after each yielded generation it holds
+    the population of the next generation, so a paused run can be resumed
+    by passing it again along with the next `start_generation`.
+    The exact fitness values known between generations are kept in `cache`
+    (also updated in place), which must be passed again as well for the resumed
+    run to sample the same fitness values as an uninterrupted one.
     """
-    pop = initpopulation(
-        params.initial_population_size, params.chromosome_length, random=rng
-    )
+    stats = stats if stats is not None else RunStats()
+    start = time.perf_counter()
 
-    for gen in range(1, params.max_generation_span + 1):
+    if population is None:
+        population = initpopulation(
+            params.initial_population_size, params.chromosome_length, random=rng
+        )
+    pop = population
+
+    # exact fitness values of the previous generation
+    # (all of them at full fidelity, the re-scored ones while sampling)
+    cache = cache if cache is not None else {}
+    for gen in range(start_generation, params.max_generation_span + 1):
         # evaluate fitnesses
-        fitnesses = {c: fitness(c) for c in pop}
+        fraction = params.sample_size(gen)
+        fitnesses = evaluate(
+            pop,
+            fitness,
+            fraction=fraction,
+            n_full=params.full_evaluations,
+            executor=executor,
+            cache=cache,
+            stats=stats,
+        )
+        for c in [c for c in cache if c not in fitnesses]:
+            del cache[c]
 
         # selection
-        pop = selection(pop, fitness=lambda c: -fitnesses[c])
+        pop[:] = selection(pop, fitness=lambda c: -fitnesses[c])
 
         # crossover
         for i in range(0, len(pop), 2):
@@ -58,7 +153,242 @@ def genetic_algorithm(
             if rng.random() < params.mutation_rate:
                 pop[i] = mutation(pop[i])
 
+        # immigration
+        if params.immigrants is not None:
+            duplicates, immigrants = immigrate(
+                pop, fitnesses, params, mutation=mutation, random=rng
+            )
+            stats.duplicates += duplicates
+            stats.immigrants += immigrants
+
+        stats.elapsed += time.perf_counter() - start
         yield fitnesses
+        start = time.perf_counter()
+
+        if stats.exhausted(params):
+            break
+
+
+def steady_state_genetic_algorithm(
+    params: Parameters,
+    crossover: "Crossover",
+    *,
+    mutation: "Mutation",
+    selection: "Selection",
+    fitness: "Evaluator",
+    rng: Random,
+    executor: "EvaluationExecutor | None" = None,
+    stats: RunStats | None = None,
+    population: list[str] | None = None,
+    start_generation: int = 1,
+    cache: dict[str, float] | None = None,
+) -> Generator[dict[str, float], None, None]:
+    """steady-state variant of the genetic algorithm
+    instead of replacing the whole population every generation,
+    each step selects parents, produces `params.offspring` children
+    (crossover and mutation), evaluates only those children,
+    and lets each child replace the worst chromosome of the population
+    if it is better and not already in the population.
+
+    Progress is reported in equivalent generations: the fitness values of the
+    population are yielded every `initial_population_size` children,
+    so the iterator can be consumed exactly like `genetic_algorithm`.
+    Chromosomes are always evaluated on the full text: sampling and immigrants
+    are not supported (a ValueError is raised).
+
+    As with `genetic_algorithm`, a run is resumed by passing its `population`
+    and `cache` again: the cache holds the fitness values of the members of
+    the population, so they are not evaluated again.
+    """
+    if params.sample_fraction < 1.0:
+        raise ValueError("the steady-state engine does not support sampling")
+    if params.immigrants is not None:
+        raise ValueError("the steady-state engine does not support immigrants")
+    if params.offspring < 1:
+        raise ValueError("the steady-state engine needs at least 1 offspring per step")
+
+    stats = stats if stats is not None else RunStats()
+    start = time.perf_counter()
+
+    if population is None:
+        population = initpopulation(
+            params.initial_population_size, params.chromosome_length, random=rng
+        )
+    pop = population
+
+    members = Counter(pop)
+    # fitness values of the members of the population
+    fitnesses = cache if cache is not None else {}
+    for c in [c for c in fitnesses if c not in members]:
+        del fitnesses[c]
+    if len(fitnesses) < len(members):
+        evaluate(
+            pop,
+            fitness,
+            fraction=1.0,
+            n_full=0,
+            executor=executor,
+            cache=fitnesses,
+            stats=stats,
+        )
+    # max-heap (by fitness value) of the indices of the population,
+    # the worst chromosome is on top
+    worst = [(-fitnesses[c], i) for i, c in enumerate(pop)]
+    heapq.heapify(worst)
+
+    for gen in range(start_generation, params.max_generation_span + 1):
+        produced = 0
+        while produced < len(pop):
+            children = []
+            while len(children) < params.offspring:
+                # selection
+                c1, c2 = selection.select(pop, lambda c: -fitnesses[c], 2)
+
+                # crossover
+                if rng.random() < params.crossover_rate:
+                    c1, c2 = crossover(c1, c2)
+
+                # mutation
+                if rng.random() < params.mutation_rate:
+                    c1 = mutation(c1)
+                if rng.random() < params.mutation_rate:
+                    c2 = mutation(c2)
+                children += [c1, c2]
+            del children[params.offspring :]  # odd number of offspring
+            produced += len(children)
+
+            scores = evaluate(
+                children,
+                fitness,
+                fraction=1.0,
+                n_full=0,
+                executor=executor,
+                cache=fitnesses,
+                stats=stats,
+            )
+
+            # replacement
+            for child in children:
+                score, i = worst[0]
+                if scores[child] < -score and child not in members:
+                    members[pop[i]] -= 1
+                    if members[pop[i]] == 0:
+                        del members[pop[i]]
+                        del fitnesses[pop[i]]
+                    pop[i] = child
+                    members[child] += 1
+                    fitnesses[child] = scores[child]
+                    heapq.heapreplace(worst, (-scores[child], i))
+            # only keep the fitness values of the members
+            for child in children:
+                if child not in members:
+                    fitnesses.pop(child, None)
+
+        stats.elapsed += time.perf_counter() - start
+        yield {c: fitnesses[c] for c in pop}
+        start = time.perf_counter()
+
+        if stats.exhausted(params):
+            break
+
+
+def evaluate(
+    population: list[str],
+    fitness: "Evaluator",
+    *,
+    fraction: float,
+    n_full: int,
+    executor: "EvaluationExecutor | None" = None,
+    cache: dict[str, float] | None = None,
+    stats: RunStats | None = None,
+) -> dict[str, float]:
+    """evaluates the fitness of each distinct chromosome in the population
+
+    If `fraction` is below 1, chromosomes are scored on a sample of the cipher text,
+    then the best `n_full` of them are re-scored on the full text.
+    Re-scoring continues until the best fitness value is an exact (full text) one,
+    so the best reported fitness is never a sampled estimate.
+
+    Duplicates, and chromosomes found in `cache` (exact fitness values),
+    are not evaluated again. Every exact fitness value computed is added to `cache`.
+    """
+    stats = stats if stats is not None else RunStats()
+    cache = cache if cache is not None else {}
+    if fraction < 1.0 and fitness.subsample(fraction) is fitness:
+        fraction = 1.0  # sampling would not make the evaluator any cheaper
+
+    distinct = list(dict.fromkeys(population))
+    missing = [c for c in distinct if c not in cache]
+    if executor is not None:
+        scores = executor.map(missing, fraction)
+    else:
+        sample = fitness.subsample(fraction) if fraction < 1.0 else fitness
+        scores = [sample(c) for c in missing]
+    scored = dict(zip(missing, scores))
+    fitnesses = {c: scored[c] if c in scored else cache[c] for c in distinct}
+
+    stats.evaluations += len(missing)
+    stats.cache_hits += len(population) - len(missing)
+
+    if fraction >= 1.0:
+        cache.update(scored)
+        return fitnesses
+
+    exact = {c for c in distinct if c in cache}
+    for c in sorted(fitnesses, key=fitnesses.get)[:n_full]:
+        if c not in exact:
+            fitnesses[c] = cache[c] = fitness(c)
+            stats.evaluations += 1
+            exact.add(c)
+
+    best = min(fitnesses, key=fitnesses.get)
+    while best not in exact:
+        fitnesses[best] = cache[best] = fitness(best)
+        stats.evaluations += 1
+        exact.add(best)
+        best = min(fitnesses, key=fitnesses.get)
+
+    return fitnesses
+
+
+def immigrate(
+    population: list[str],
+    fitnesses: dict[str, float],
+    params: Parameters,
+    *,
+    mutation: "Mutation",
+    random: Random,
+    attempts: int = 10,
+) -> tuple[int, int]:
+    """replaces (in place) every duplicate chromosome of the population
+    with an immigrant that is not in the population yet:
+    either a random chromosome, or a mutant of one of the best chromosomes
+    (the best 10% of the previous generation).
+
+    Returns the number of duplicates found and the number replaced.
+    """
+    seen = set()
+    duplicates = []
+    for i, c in enumerate(population):
+        if c in seen:
+            duplicates.append(i)
+        seen.add(c)
+
+    elites = sorted(fitnesses, key=fitnesses.get)[: max(1, len(fitnesses) // 10)]
+
+    replaced = 0
+    for i in duplicates:
+        for _ in range(attempts):
+            if params.immigrants == "elite":
+                immigrant = mutation(random.choice(elites))
+            else:
+                immigrant = "".join(random.choices(ALLELES, k=params.chromosome_length))
+            if immigrant not in seen:
+                population[i] = immigrant
+                seen.add(immigrant)
+                replaced += 1
+                break
+    return len(duplicates), replaced
 
 
 def initpopulation(
@@ -1,12 +1,28 @@
 import sys
 import argparse
+import pathlib
+import time
 from random import Random
+from typing import TYPE_CHECKING, Any
 
-from . import genetic_algorithm, Parameters, ALLELES
-from .mutations import Mutation, ReciprocalExchangeMutation, RandomCharacterMutation
-from .crossovers import Crossover, UniformCrossover, OrderCrossover
-from .selections import Selection, TournamentSelection, WithElitism
-from .evaluators import ExpectedCharFrequencyEvaluator
+from . import initpopulation, Parameters, RunStats
+from .checkpoint import Checkpoint, resize_population
+from .registry import (
+    CROSSOVERS,
+    ENGINES,
+    EVALUATORS,
+    MUTATIONS,
+    SELECTIONS,
+    crossover_algorithm,
+    engine_algorithm,
+    evaluator_algorithm,
+    mutation_algorithm,
+    selection_algorithm,
+)
+from .tables import CipherTables, cached, load
+
+if TYPE_CHECKING:
+    from .evaluators import Evaluator
 
 parser = argparse.ArgumentParser(
     prog="Genetic Algorithm", description="performs genetic algorithm"
@@ -38,7 +54,7 @@ parser.add_argument(
     ox - Order crossover
     """,
     type=str,
-    choices=("ux", "ox"),
+    choices=CROSSOVERS,
     default="ux",
 )
 parser.add_argument(
@@ -49,7 +65,7 @@ parser.add_argument(
     rc - Random Character mutation
     """,
     type=str,
-    choices=("rx", "rc"),
+    choices=MUTATIONS,
     default="rx",
 )
 parser.add_argument(
@@ -59,7 +75,7 @@ parser.add_argument(
     tour{k} - Tournament selection
     """,
     type=str,
-    choices=("tour2", "tour3", "tour4", "tour5"),
+    choices=SELECTIONS,
     default="tour2",
 )
 parser.add_argument(
@@ -86,6 +102,36 @@ parser.add_argument(
     type=int,
     default=20,
 )
+parser.add_argument(
+    "--max-evaluations",
+    dest="max_evaluations",
+    help="Stop after this many fitness evaluations [default: None]",
+    type=int,
+)
+parser.add_argument(
+    "--max-seconds",
+    dest="max_seconds",
+    help="Stop after running for this many seconds [default: None]",
+    type=float,
+)
+parser.add_argument(
+    "-e",
+    "--evaluator",
+    dest="evaluator",
+    help="""Fitness function: [default: freq]
+    freq - Expected character frequency
+    bigram, trigram, quadgram - N-gram log-likelihood
+    """,
+    type=str,
+    choices=EVALUATORS,
+    default="freq",
+)
+parser.add_argument(
+    "--corpus",
+    dest="corpus",
+    help="Text file to build n-gram tables from [default: bundled english corpus]",
+    type=pathlib.Path,
+)
 parser.add_argument(
     "-o",
     "--output-format",
@@ -109,6 +155,117 @@ parser.add_argument(
     type=int,
     default=2,
 )
+parser.add_argument(
+    "--sample-fraction",
+    dest="sample_fraction",
+    help="""Fraction of the encrypted text used to evaluate the first generation [default: 1.0]
+     the sample grows linearly to the full text over `--sample-ramp` generations
+    """,
+    type=float,
+    default=1.0,
+)
+parser.add_argument(
+    "--sample-ramp",
+    dest="sample_ramp",
+    help="Number of generations evaluated on a sample of the encrypted text [default: 0]",
+    type=int,
+    default=0,
+)
+parser.add_argument(
+    "--full-evaluations",
+    dest="full_evaluations",
+    help="Number of best candidates re-scored on the full text when sampling [default: 2]",
+    type=int,
+    default=2,
+)
+parser.add_argument(
+    "--immigrants",
+    dest="immigrants",
+    help="""Replace duplicate chromosomes each generation with: [default: keep duplicates]
+    random - random chromosomes
+    elite - mutants of the best chromosomes
+    """,
+    type=str,
+    choices=("random", "elite"),
+)
+parser.add_argument(
+    "--engine",
+    dest="engine",
+    help="""Genetic algorithm variant: [default: generational]
+    generational - replace the whole population each generation
+    steady - replace the worst chromosomes with a few offspring at a time
+    """,
+    type=str,
+    choices=ENGINES,
+    default="generational",
+)
+parser.add_argument(
+    "--offspring",
+    dest="offspring",
+    help="Number of offspring produced per step of the steady-state engine [default: 2]",
+    type=int,
+    default=2,
+)
+parser.add_argument(
+    "-j",
+    "--eval-workers",
+    dest="eval_workers",
+    help="Number of processes used to evaluate each generation [default: evaluate serially]",
+    type=int,
+)
+parser.add_argument(
+    "--cache-dir",
+    dest="cache_dir",
+    help="Directory to cache the preprocessed encrypted text in [default: no cache]",
+    type=pathlib.Path,
+)
+parser.add_argument(
+    "--target-fitness",
+    dest="target_fitness",
+    help="Stop once a solution reaches this fitness value (or lower) [default: None]",
+    type=float,
+)
+parser.add_argument(
+    "--restarts",
+    dest="restarts",
+    help="""Number of independently seeded runs [default: 1]
+     seeds are `--seed`, `--seed + 1`, ... (random if no seed is given);
+     the remaining runs are cancelled once one reaches `--target-fitness`
+    """,
+    type=int,
+    default=1,
+)
+parser.add_argument(
+    "--restart-workers",
+    dest="restart_workers",
+    help="Number of processes running restarts in parallel [default: number of CPUs]",
+    type=int,
+)
+parser.add_argument(
+    "--checkpoint",
+    dest="checkpoint",
+    help="File to periodically save the state of the run to [default: None]",
+    type=pathlib.Path,
+)
+parser.add_argument(
+    "--checkpoint-every",
+    dest="checkpoint_every",
+    help="Number of generations between checkpoints [default: 10]",
+    type=int,
+    default=10,
+)
+parser.add_argument(
+    "--resume",
+    dest="resume",
+    help="Checkpoint file to resume the run from (up to `--max-generations`)",
+    type=pathlib.Path,
+)
+parser.add_argument(
+    "--init-population",
+    dest="init_population",
+    help="Checkpoint file to take the initial population from [default: random population]",
+    type=pathlib.Path,
+)
 parser.add_argument(
     "-s",
     "--seed",
@@ -118,43 +275,26 @@ parser.add_argument(
 )
 
 
-def mutation_algorithm(alg: str, random: Random) -> Mutation:
-    """selects the mutation algorithm to use
-    based on provided CLI option
-    """
-    if alg == "rc":
-        return RandomCharacterMutation(alleles=list(ALLELES), random=random)
-    else:
-        return ReciprocalExchangeMutation(random=random)
-
+def read_input(args: argparse.Namespace) -> str:
+    """reads the encrypted text from the input file given in the CLI options"""
+    with args.inputfile as f:
+        return f.read().strip()
 
-def crossover_algorithm(alg: str, random: Random) -> Crossover:
-    """selects the crossover algorithm to use
-    based on provided CLI option
-    """
-    if alg == "ox":
-        return OrderCrossover(random=random)
-    else:
-        return UniformCrossover(random=random)
 
+def solve(
+    args: argparse.Namespace,
+    fitness: "Evaluator",
+    cancel: Any | None = None,
+    progress: Any | None = None,
+) -> tuple[str, float, RunStats]:
+    """runs the genetic algorithm configured by the CLI options
+    and returns the best solution and fitness value of the final generation,
+    along with the statistics of the run.
 
-def selection_algorithm(alg: str, random: Random) -> Selection:
-    """selects the selection algorithm to use
-    based on provided CLI option
+    The run stops early once the target fitness is reached,
+    or once the `cancel` event (if given) is set.
+    The statistics of each generation are sent to the `progress` channel, if given.
     """
-    if alg.startswith("tour"):
-        k = int(alg.replace("tour", ""))
-        return TournamentSelection(k=k, random=random)
-    else:
-        return TournamentSelection(k=2, random=random)
-
-
-def main() -> int:
-    args = parser.parse_args()
-
-    with args.inputfile as f:
-        text = f.read().strip()
-
     rng = Random(args.random_seed)
 
     # construct parameters
@@ -164,40 +304,236 @@ def main() -> int:
         max_generation_span=args.max_generations,
         crossover_rate=args.crossover_rate,
         mutation_rate=args.mutation_rate,
+        sample_fraction=args.sample_fraction,
+        sample_ramp=args.sample_ramp,
+        full_evaluations=args.full_evaluations,
+        max_evaluations=args.max_evaluations,
+        max_seconds=args.max_seconds,
+        immigrants=args.immigrants,
+        offspring=args.offspring,
     )
 
     crossover = crossover_algorithm(args.crossover_alg, random=rng)
     mutation = mutation_algorithm(args.mutation_alg, random=rng)
 
-    selection = WithElitism(
-        selection_algorithm(args.selection_alg, random=rng),
-        random=rng,
-        n_elites=args.n_elites,
+    selection = selection_algorithm(
+        args.selection_alg, random=rng, n_elites=args.n_elites
     )
 
+    stats = RunStats()
+    best = None  # best solution so far
+    start = 1
+    cache: dict[str, float] = {}  # exact fitness values known to the engine
+    if args.resume is not None:
+        # continue exactly where the checkpointed run stopped
+        checkpoint = Checkpoint.load(args.resume)
+        checkpoint.restore(rng, stats)
+        population = checkpoint.population
+        best = checkpoint.best
+        start = checkpoint.generation + 1
+        cache = checkpoint.cache
+    elif args.init_population is not None:
+        # start a new run from a saved population
+        population = resize_population(
+            Checkpoint.load(args.init_population).population, params, random=rng
+        )
+    else:
+        population = initpopulation(
+            params.initial_population_size, params.chromosome_length, random=rng
+        )
+
+    executor = None
+    if args.eval_workers:
+        from .executors import EvaluationExecutor
+
+        executor = EvaluationExecutor(fitness, workers=args.eval_workers)
+
     # create genetic algorithm iterator
-    g = genetic_algorithm(
+    g = engine_algorithm(args.engine)(
         params,
         crossover=crossover,
         mutation=mutation,
         selection=selection,
-        # use default fitness function
-        fitness=ExpectedCharFrequencyEvaluator(text),
+        fitness=fitness,
         rng=rng,
+        executor=executor,
+        stats=stats,
+        population=population,
+        start_generation=start,
+        cache=cache,
     )
 
-    # run the GA and get all generation fitness values
-    generations = list(g)
-    # get the final set of fitness values
-    final_generation_fitness_map = generations[-1]
+    # run the GA, keeping the fitness values of the final generation
+    final_generation_fitness_map = {}
+    try:
+        for gen, final_generation_fitness_map in enumerate(g, start):
+            generation_best = max(
+                final_generation_fitness_map.items(), key=lambda tup: -tup[1]
+            )
+            if best is None or generation_best[1] < best[1]:
+                best = generation_best
+
+            if progress is not None:
+                progress.put(
+                    dict(
+                        generation=gen,
+                        best_solution=best[0],
+                        best_fitness=best[1],
+                        evaluations=stats.evaluations,
+                        cache_hits=stats.cache_hits,
+                        elapsed=stats.elapsed,
+                    )
+                )
+
+            if args.checkpoint is not None and gen % args.checkpoint_every == 0:
+                Checkpoint.capture(gen, population, rng, best, stats, cache).save(
+                    args.checkpoint
+                )
+
+            if args.target_fitness is not None and best[1] <= args.target_fitness:
+                break
+            if cancel is not None and cancel.is_set():
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if args.checkpoint is not None and final_generation_fitness_map:
+        Checkpoint.capture(gen, population, rng, best, stats, cache).save(
+            args.checkpoint
+        )
+
+    if not final_generation_fitness_map:
+        # resumed a run that had already finished
+        solution, fitness = best
+        return solution, fitness, stats
 
     # get the best solution and fitness value from final generation
     solution, fitness = max(
         final_generation_fitness_map.items(), key=lambda tup: -tup[1]
     )
+    return solution, fitness, stats
+
+
+# state shared with the restart worker processes (set by `_init_restart`)
+_restart_fitness: "Evaluator | None" = None
+_restart_cancel: Any | None = None
+
+
+def _init_restart(fitness: "Evaluator", cancel: Any):
+    global _restart_fitness, _restart_cancel
+    _restart_fitness = fitness
+    _restart_cancel = cancel
+
+
+def _restart(options: dict, seed: int) -> tuple[str, float, RunStats]:
+    args = argparse.Namespace(**options, random_seed=seed)
+    result = solve(args, _restart_fitness, cancel=_restart_cancel)
+    if args.target_fitness is not None and result[1] <= args.target_fitness:
+        _restart_cancel.set()  # stop the other restarts
+    return result
+
+
+def solve_restarts(
+    args: argparse.Namespace, fitness: "Evaluator"
+) -> tuple[str, float, int, RunStats]:
+    """runs `--restarts` independently seeded genetic algorithms
+    across `--restart-workers` processes, and returns the best solution and
+    fitness value along with the seed that produced it, and the combined
+    statistics of the runs (elapsed time is wall-clock time, so throughput is
+    the aggregate of the processes)
+    """
+    import concurrent.futures
+    import multiprocessing
+
+    start = time.perf_counter()
+
+    if args.random_seed is not None:
+        seeds = [args.random_seed + i for i in range(args.restarts)]
+    else:
+        seeds = [Random().randrange(2**32) for _ in range(args.restarts)]
+
+    options = vars(args).copy()
+    del options["inputfile"], options["random_seed"]
+
+    # the fitness function (and preprocessed text) is sent to each process once
+    cancel = multiprocessing.Event()
+    with concurrent.futures.ProcessPoolExecutor(
+        args.restart_workers, initializer=_init_restart, initargs=(fitness, cancel)
+    ) as executor:
+        futures = {executor.submit(_restart, options, seed): seed for seed in seeds}
+
+        best = None
+        stats = RunStats()
+        for future in concurrent.futures.as_completed(futures):
+            if future.cancelled():
+                continue
+            solution, fit, run_stats = future.result()
+            stats.evaluations += run_stats.evaluations
+            stats.cache_hits += run_stats.cache_hits
+            stats.duplicates += run_stats.duplicates
+            stats.immigrants += run_stats.immigrants
+            if best is None or fit < best[1]:
+                best = (solution, fit, futures[future])
+
+            if args.target_fitness is not None and fit <= args.target_fitness:
+                for pending in futures:
+                    pending.cancel()
+
+    stats.elapsed = time.perf_counter() - start
+    solution, fit, seed = best
+    return solution, fit, seed, stats
+
+
+def main() -> int:
+    args = parser.parse_args()
+
+    if args.restarts < 1:
+        parser.error("--restarts must be at least 1")
+    if args.restart_workers is not None and args.restart_workers < 1:
+        parser.error("--restart-workers must be at least 1")
+    if args.restarts > 1 and (args.checkpoint or args.resume):
+        parser.error("--restarts cannot be combined with --checkpoint or --resume")
+    if args.engine == "steady":
+        for flag in (
+            "immigrants",
+            "sample_fraction",
+            "sample_ramp",
+            "full_evaluations",
+        ):
+            if getattr(args, flag) != parser.get_default(flag):
+                option = "--" + flag.replace("_", "-")
+                parser.error(f"--engine steady cannot be combined with {option}")
+    if args.offspring < 1:
+        parser.error("--offspring must be at least 1")
+    if not 0.0 < args.sample_fraction <= 1.0:
+        parser.error("--sample-fraction must be in (0, 1]")
+
+    text = read_input(args)
+
+    if args.cache_dir is not None:
+        tables = load(cached(text, args.cache_dir))
+    else:
+        tables = CipherTables.compute(text)
+    corpus = args.corpus.read_text() if args.corpus is not None else None
+    evaluator = evaluator_algorithm(args.evaluator, tables, corpus)
+
+    if args.restarts > 1:
+        solution, fitness, seed, stats = solve_restarts(args, evaluator)
+    else:
+        solution, fitness, stats = solve(args, evaluator)
+        seed = args.random_seed
 
     print(f"Best Solution: {solution}")
     print(f"Best Fitness: {fitness}")
+    if args.restarts > 1:
+        print(f"Best Seed: {seed}")
+    print(f"Evaluations: {stats.evaluations}")
+    print(f"Cache Hits: {stats.cache_hits}")
+    print(f"Evaluations/s: {stats.evaluations_per_second:.1f}")
+    if args.immigrants is not None:
+        print(f"Duplicates: {stats.duplicates}")
+        print(f"Immigrants: {stats.immigrants}")
 
     return 0
 
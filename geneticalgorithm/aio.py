@@ -0,0 +1,211 @@
+"""asyncio interface to the genetic algorithm
+
+The genetic algorithm is CPU-bound and blocking, so each cracking job runs in a
+worker of a (thread or process) pool, and reports the statistics of each
+generation through a channel shared by all the jobs of a runner. A single
+reader thread per runner forwards the updates to the event loop, so it keeps
+serving other tasks while any number of jobs run:
+
+    async with GARunner() as runner:
+        async with runner.run(options(["26", "-s", "3"]), text) as stream:
+            async for update in stream:
+                print(update["generation"], update["best_fitness"])
+            result = await stream.result()
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+import queue
+import threading
+from typing import Any
+
+from .__main__ import parser
+from .server import crack, job_options
+
+# seconds between checks of the cancellation event while waiting to send an update
+POLL = 0.1
+
+
+def options(argv: list[str]) -> dict:
+    """options of a cracking job, from `geneticalgorithm` CLI arguments
+    (the input file, if any, is ignored: the text is given to `GARunner.run`)
+    """
+    return job_options(parser.parse_args(argv))
+
+
+class _Channel:
+    """sends the updates of a job through the channel shared by the runner.
+    Each update takes one of the job's `credits`, given back once it is consumed:
+    without credits the worker waits (backpressure) until updates are consumed,
+    or until the job is cancelled, in which case further updates are dropped
+    """
+
+    def __init__(self, updates: Any, job: int, credits: Any, cancel: Any):
+        self.updates = updates
+        self.job = job
+        self.credits = credits
+        self.cancel = cancel
+
+    def put(self, update: dict):
+        while not self.cancel.is_set():
+            if self.credits.acquire(timeout=POLL):
+                self.updates.put((self.job, update))
+                return
+
+
+class GAStream:
+    """asynchronous iterator over the statistics of each generation of a job
+
+    Used as an async context manager, the job is cancelled if it is still running
+    when the block exits (e.g. the consumer stops iterating early).
+    """
+
+    def __init__(self, channel: _Channel):
+        self.channel = channel
+        self.future: concurrent.futures.Future | None = None  # set once submitted
+        # updates forwarded by the runner (at most `buffer` of them, thanks to
+        # the credits of the channel), followed by None
+        self.updates: asyncio.Queue[dict | None] = asyncio.Queue()
+        self.finished = False  # all updates consumed
+
+    def __aiter__(self) -> "GAStream":
+        return self
+
+    async def __anext__(self) -> dict:
+        update = await self.updates.get() if not self.finished else None
+        if update is None:
+            self.finished = True
+            raise StopAsyncIteration
+        if not self.future.done():  # otherwise the job sends no more updates
+            # a round-trip to the manager with a process pool: not on the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.channel.credits.release
+            )
+        return update
+
+    def cancel(self):
+        """stops the job after its current generation
+        (or before it starts, if it is still waiting for a worker)
+        """
+        self.channel.cancel.set()
+        self.future.cancel()
+
+    async def result(self) -> dict:
+        """waits for the job to finish (discarding the remaining updates)
+        and returns its result (see `server.crack`).
+        Raises `concurrent.futures.CancelledError` if the job was cancelled
+        before it started.
+        """
+        async for _ in self:
+            pass
+        if self.future.cancelled():
+            raise concurrent.futures.CancelledError()
+        return await asyncio.wrap_future(self.future)
+
+    async def __aenter__(self) -> "GAStream":
+        return self
+
+    async def __aexit__(self, *exc):
+        if not self.future.done():
+            self.cancel()
+        try:
+            await self.result()
+        except concurrent.futures.CancelledError:
+            pass  # the job was cancelled (not the task running this block)
+
+
+class GARunner:
+    """runs cracking jobs concurrently on a shared pool of workers
+
+    `executor` is either a thread or a process pool [default: a process pool
+    with one process per CPU, shut down with the runner]. At most `buffer`
+    updates of each job are queued before the job waits for them to be consumed.
+    Jobs are started (`run`) from the event loop that consumes their updates.
+    """
+
+    def __init__(
+        self, executor: concurrent.futures.Executor | None = None, buffer: int = 16
+    ):
+        self.owned = executor is None
+        self.executor = executor or concurrent.futures.ProcessPoolExecutor()
+        self.buffer = buffer
+        self.manager = None
+        if isinstance(self.executor, concurrent.futures.ProcessPoolExecutor):
+            import multiprocessing
+
+            # queues, semaphores and events shared with the worker processes
+            self.manager = multiprocessing.Manager()
+            self.updates = self.manager.Queue()
+        else:
+            self.updates = queue.Queue()
+
+        self.jobs = itertools.count()
+        self.streams: dict[int, tuple[GAStream, asyncio.AbstractEventLoop]] = {}
+        self.lock = threading.Lock()
+        self.closed = False
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    def run(self, args: dict, text: str) -> GAStream:
+        """starts cracking `text` with the options `args` (see `options`)"""
+        job = next(self.jobs)
+        if self.manager is not None:
+            credits = self.manager.Semaphore(self.buffer)
+            cancel = self.manager.Event()
+        else:
+            credits = threading.Semaphore(self.buffer)
+            cancel = threading.Event()
+        stream = GAStream(_Channel(self.updates, job, credits, cancel))
+        with self.lock:
+            self.streams[job] = (stream, asyncio.get_running_loop())
+
+        stream.future = self.executor.submit(
+            crack, args, text, cancel=cancel, progress=stream.channel
+        )
+        # the end of the job follows its updates through the channel,
+        # whether it finished, failed or was cancelled before it started
+        stream.future.add_done_callback(lambda _: self._end(job))
+        return stream
+
+    def _end(self, job: int):
+        if not self.closed:
+            self.updates.put((job, None))
+
+    def _read(self):
+        """forwards the updates of every job to the event loop of its stream"""
+        while (item := self.updates.get()) is not None:
+            job, update = item
+            with self.lock:
+                if update is None:
+                    stream, loop = self.streams.pop(job)
+                else:
+                    stream, loop = self.streams[job]
+            try:
+                loop.call_soon_threadsafe(stream.updates.put_nowait, update)
+            except RuntimeError:
+                pass  # the event loop of the stream was closed
+
+    def shutdown(self):
+        """cancels the jobs still running (whether their updates are consumed
+        or not), waits for them to stop and releases the resources of the runner
+        """
+        with self.lock:
+            streams = [stream for stream, _ in self.streams.values()]
+        for stream in streams:
+            stream.cancel()
+        if self.owned:
+            self.executor.shutdown(cancel_futures=True)
+        else:
+            concurrent.futures.wait([stream.future for stream in streams])
+        self.closed = True
+        self.updates.put(None)
+        self.reader.join()
+        if self.manager is not None:
+            self.manager.shutdown()
+
+    async def __aenter__(self) -> "GARunner":
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
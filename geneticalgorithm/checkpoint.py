@@ -0,0 +1,100 @@
+import gzip
+import json
+import os
+import pathlib
+from dataclasses import asdict, dataclass, field
+from random import Random
+
+from . import ALLELES, Parameters, RunStats, initpopulation
+
+
+@dataclass
+class Checkpoint:
+    """state of a genetic algorithm run between two generations"""
+
+    generation: int  # number of generations completed
+    population: list[str]  # population of the next generation
+    rng_state: tuple
+    best_solution: str | None = None  # best solution so far
+    best_fitness: float | None = None
+    evaluations: int = 0
+    cache_hits: int = 0
+    elapsed: float = 0.0
+    duplicates: int = 0
+    immigrants: int = 0
+    # exact fitness values known to the engine (see `genetic_algorithm`)
+    cache: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def capture(
+        cls,
+        generation: int,
+        population: list[str],
+        rng: Random,
+        best: tuple[str, float] | None,
+        stats: RunStats,
+        cache: dict[str, float],
+    ) -> "Checkpoint":
+        best_solution, best_fitness = best if best is not None else (None, None)
+        return cls(
+            generation=generation,
+            population=list(population),
+            rng_state=rng.getstate(),
+            best_solution=best_solution,
+            best_fitness=best_fitness,
+            evaluations=stats.evaluations,
+            cache_hits=stats.cache_hits,
+            elapsed=stats.elapsed,
+            duplicates=stats.duplicates,
+            immigrants=stats.immigrants,
+            cache=dict(cache),
+        )
+
+    def restore(self, rng: Random, stats: RunStats):
+        """restores the random generator and statistics of the run"""
+        rng.setstate(self.rng_state)
+        stats.evaluations = self.evaluations
+        stats.cache_hits = self.cache_hits
+        stats.elapsed = self.elapsed
+        stats.duplicates = self.duplicates
+        stats.immigrants = self.immigrants
+
+    @property
+    def best(self) -> tuple[str, float] | None:
+        if self.best_solution is None:
+            return None
+        return self.best_solution, self.best_fitness
+
+    def save(self, path: pathlib.Path):
+        """writes the checkpoint as gzip-compressed JSON.
+        The file is replaced atomically, so a crash never leaves a partial checkpoint
+        """
+        tmp = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp, "wt") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "Checkpoint":
+        with gzip.open(path, "rt") as f:
+            data = json.load(f)
+        # JSON turns the (nested) tuples of the random state into lists
+        version, internal, gauss_next = data["rng_state"]
+        data["rng_state"] = (version, tuple(internal), gauss_next)
+        return cls(**data)
+
+
+def resize_population(
+    population: list[str], params: Parameters, *, random: Random
+) -> list[str]:
+    """adapts a saved population to new parameters (to warm-start a run),
+    truncating or padding the chromosomes with random alleles to the new length,
+    and dropping or adding random chromosomes to the new population size
+    """
+    length = params.chromosome_length
+    population = [
+        c[:length] + "".join(random.choices(ALLELES, k=length - len(c)))
+        for c in population[: params.initial_population_size]
+    ]
+    missing = params.initial_population_size - len(population)
+    return population + initpopulation(missing, length, random=random)
@@ -0,0 +1,106 @@
+import argparse
+import json
+import pathlib
+import socket
+import sys
+
+from . import decrypt
+from . import __main__ as ga
+from .server import job_options
+
+parser = argparse.ArgumentParser(
+    prog="GA Client",
+    description="sends genetic algorithm and decryption jobs to a running server",
+)
+
+parser.add_argument(
+    "command",
+    help="""Job to run on the server:
+    crack - same arguments as `geneticalgorithm`
+    decrypt - same arguments as `decrypt`
+    """,
+    type=str,
+    choices=("crack", "decrypt"),
+)
+parser.add_argument(
+    "argv",
+    help="Arguments for the job",
+    nargs=argparse.REMAINDER,
+)
+parser.add_argument(
+    "--unix",
+    dest="unix_socket",
+    help="Path of the server's unix domain socket [default: use TCP]",
+    type=pathlib.Path,
+)
+parser.add_argument(
+    "--host",
+    dest="host",
+    help="Host of the server [default: 127.0.0.1]",
+    type=str,
+    default="127.0.0.1",
+)
+parser.add_argument(
+    "--port",
+    dest="port",
+    help="Port of the server [default: 8765]",
+    type=int,
+    default=8765,
+)
+
+
+def connect(args: argparse.Namespace) -> socket.socket:
+    """opens a connection to the server given in the CLI options"""
+    if args.unix_socket is not None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(args.unix_socket))
+        return sock
+    return socket.create_connection((args.host, args.port))
+
+
+def main() -> int:
+    args = parser.parse_args()
+
+    # parse and read job input exactly as the standalone CLIs do
+    if args.command == "crack":
+        job_args = ga.parser.parse_args(args.argv)
+        text = ga.read_input(job_args)
+        try:
+            options = job_options(job_args)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        job_args = decrypt.parser.parse_args(args.argv)
+        text = decrypt.read_input(job_args)
+        del job_args.filepath
+        options = vars(job_args)
+
+    job = dict(command=args.command, args=options, text=text)
+
+    with connect(args) as sock, sock.makefile("rwb") as f:
+        f.write(json.dumps(job).encode() + b"\n")
+        f.flush()
+        response = json.loads(f.readline())
+
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return 1
+
+    result = response["result"]
+    if args.command == "crack":
+        print(f"Best Solution: {result['solution']}")
+        print(f"Best Fitness: {result['fitness']}")
+        print(f"Evaluations: {result['evaluations']}")
+        print(f"Cache Hits: {result['cache_hits']}")
+        print(f"Evaluations/s: {result['evaluations_per_second']:.1f}")
+        if job_args.immigrants is not None:
+            print(f"Duplicates: {result['duplicates']}")
+            print(f"Immigrants: {result['immigrants']}")
+    else:
+        print(result["plain"])
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
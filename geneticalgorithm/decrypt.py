@@ -23,14 +23,18 @@ parser.add_argument(
 )
 
 
+def read_input(args: argparse.Namespace) -> str:
+    """reads the encrypted text from the file given in the CLI options"""
+    if args.filepath is not None:
+        with open(args.filepath) as f:
+            return f.read()
+    return "".join(sys.stdin)
+
+
 def main() -> int:
     args = parser.parse_args()
 
-    if args.filepath is not None:
-        with open(args.filepath) as f:
-            text = f.read()
-    else:
-        text = "".join(sys.stdin)
+    text = read_input(args)
 
     print(decrypt(args.key, text))
 
@@ -1,5 +1,11 @@
 import abc
-from .utils import decrypt
+import operator
+from .ngrams import NgramTable
+from .tables import CipherTables
+from .utils import key_shifts
+
+# translation tables that shift letter indices (0-25) back by each key shift
+_UNSHIFT = [bytes((c - shift) % 26 for c in range(256)) for shift in range(26)]
 
 
 class Evaluator(abc.ABC):
@@ -9,12 +15,29 @@ class Evaluator(abc.ABC):
     def __call__(self, chromosome: str) -> float:
         pass
 
+    def subsample(self, fraction: float) -> "Evaluator":
+        """returns an evaluator that only scores a deterministic sample
+        (`fraction`) of the cipher text.
+        Evaluators that cannot be sampled, or whose cost does not depend on the
+        length of the text (e.g. counting letters per column), are always
+        evaluated on the full text.
+        """
+        return self
+
 
 class ExpectedCharFrequencyEvaluator(Evaluator):
     """python implementation of fitness function provided in Evaluation.java"""
 
     def __init__(self, encrypted: str):
-        self.encrypted = encrypted
+        # normalized once, reused every call
+        self.tables = CipherTables.compute(encrypted)
+
+    @classmethod
+    def from_tables(cls, tables: CipherTables) -> "ExpectedCharFrequencyEvaluator":
+        """evaluator for an already preprocessed (e.g. cached) cipher text"""
+        evaluator = cls.__new__(cls)
+        evaluator.tables = tables
+        return evaluator
 
     def __call__(self, chromosome: str) -> float:
         expected_frequencies = [
@@ -46,18 +69,79 @@ class ExpectedCharFrequencyEvaluator(Evaluator):
             0.0011,
         ]
 
-        # decrypt each character
-        plain = [ord(i) - 97 for i in decrypt(chromosome, self.encrypted)]
-
-        # count the occurrences of each character
+        # count the occurrences of each decrypted character:
+        # every column of the cipher text (for the period of the key)
+        # is shifted by the same key character, so its letter counts
+        # only need to be rotated by that shift
+        shifts = key_shifts(chromosome) or [0]
         counts = [0] * 26
-        for i in plain:
-            counts[i] += 1
+        for column, shift in zip(self.tables.columns(len(shifts)), shifts):
+            counts = list(map(operator.add, counts, column[shift:] + column[:shift]))
 
         # calculate the total difference between the expected frequencies and actual frequencies
         score = 0.0
         for y in range(len(counts)):
-            freq = counts[y] / len(plain)
+            freq = counts[y] / len(self.tables.codes)
             score += abs(freq - expected_frequencies[y])
 
         return score
+
+
+class NgramLogLikelihoodEvaluator(Evaluator):
+    """n-gram log-likelihood
+    scores the decrypted text by the average log-probability of its n-grams
+    (e.g. bigrams or quadgrams), looked up in a dense table by rolling
+    the n-gram index over the letters.
+
+    The score is negated so that, like other fitness values, lower is better
+    """
+
+    def __init__(self, encrypted: str, ngrams: NgramTable):
+        self.tables = CipherTables.compute(encrypted)
+        self.ngrams = ngrams
+
+    @classmethod
+    def from_tables(
+        cls, tables: CipherTables, ngrams: NgramTable
+    ) -> "NgramLogLikelihoodEvaluator":
+        """evaluator for an already preprocessed (e.g. cached) cipher text"""
+        evaluator = cls.__new__(cls)
+        evaluator.tables = tables
+        evaluator.ngrams = ngrams
+        return evaluator
+
+    def subsample(self, fraction: float) -> Evaluator:
+        """scores only a prefix of the cipher text
+        (of at least one n-gram, so the sample is never scored 0.0)
+        """
+        codes = self.tables.codes
+        n = max(self.ngrams.n, round(len(codes) * fraction))
+        if n >= len(codes):
+            return self
+        return self.from_tables(CipherTables(codes[:n]), self.ngrams)
+
+    def __call__(self, chromosome: str) -> float:
+        # decrypt each column of the cipher text with its key character
+        codes = self.tables.codes
+        shifts = key_shifts(chromosome) or [0]
+        period = len(shifts)
+        plain = bytearray(len(codes))
+        for r, shift in enumerate(shifts):
+            plain[r::period] = bytes(codes[r::period]).translate(_UNSHIFT[shift])
+
+        n = self.ngrams.n
+        if len(plain) < n:
+            return 0.0
+
+        # sum the log-probabilities of every n-gram, using a rolling index
+        logprobs = self.ngrams.logprobs
+        size = len(logprobs)
+        index = 0
+        for c in plain[: n - 1]:
+            index = index * 26 + c
+        score = 0.0
+        for c in plain[n - 1 :]:
+            index = (index * 26 + c) % size
+            score += logprobs[index]
+
+        return -score / (len(plain) - n + 1)
@@ -0,0 +1,55 @@
+import concurrent.futures
+import os
+from itertools import chain
+
+from .evaluators import Evaluator
+
+# evaluator held by each worker process (set once by the pool initializer)
+_fitness: Evaluator | None = None
+
+
+def _init(fitness: Evaluator):
+    global _fitness
+    _fitness = fitness
+
+
+def _evaluate(fraction: float, chromosomes: list[str]) -> list[float]:
+    fitness = _fitness.subsample(fraction) if fraction < 1.0 else _fitness
+    return [fitness(c) for c in chromosomes]
+
+
+class EvaluationExecutor:
+    """evaluates chromosomes across a pool of worker processes
+
+    The evaluator (and therefore the cipher text) is sent to each worker
+    only once, when the worker starts, instead of with every task.
+    Evaluation does not use any random numbers, so results are identical
+    to serial evaluation regardless of the number of workers.
+    """
+
+    def __init__(self, fitness: Evaluator, workers: int | None = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            self.workers, initializer=_init, initargs=(fitness,)
+        )
+
+    def map(self, chromosomes: list[str], fraction: float = 1.0) -> list[float]:
+        """fitness values of the chromosomes (in the same order),
+        evaluated on `fraction` of the cipher text
+        """
+        if not chromosomes:
+            return []
+        # one contiguous chunk per worker
+        size = -(-len(chromosomes) // self.workers)
+        chunks = [chromosomes[i : i + size] for i in range(0, len(chromosomes), size)]
+        results = self.executor.map(_evaluate, [fraction] * len(chunks), chunks)
+        return list(chain.from_iterable(results))
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
@@ -1,37 +1,33 @@
 import argparse
 import concurrent.futures
+import contextlib
 import json
+import math
+import multiprocessing
 import pathlib
 import sys
-from itertools import product
+from dataclasses import dataclass, field
+from itertools import groupby, islice, product
 from random import Random
-from typing import TextIO
-
-from . import ALLELES, Parameters, genetic_algorithm
-from .crossovers import Crossover, OrderCrossover, UniformCrossover
-from .evaluators import ExpectedCharFrequencyEvaluator
-from .mutations import Mutation, RandomCharacterMutation, ReciprocalExchangeMutation
-from .printers import (
-    CsvPrinter,
-    PrettyPrintPrinter,
-    Printer,
-    SimplePrinter,
-    TablePrinter,
+from typing import TYPE_CHECKING, Any
+
+from . import Parameters, RunStats, initpopulation
+from .progress import ProgressMonitor, report
+from .registry import (
+    PRINTERS,
+    crossover_algorithm,
+    engine_algorithm,
+    evaluator_algorithm,
+    mutation_algorithm,
+    output_printer,
+    progress_bar,
+    selection_algorithm,
 )
-from .selections import Selection, TournamentSelection, WithElitism
-from .utils import decrypt
-
-try:
-    from tqdm import tqdm as _tqdm
-
-    def tqdm(it, *args, **kwargs):
-        return _tqdm(it, *args, **kwargs)
-except ImportError:
-    print("To see progress bar, install tqdm package", file=sys.stderr)
-
-    def tqdm(it, *args, **kwargs):
-        return it
+from .tables import CipherTables, cached, load
+from .utils import decrypt_preprocessed
 
+if TYPE_CHECKING:
+    from .evaluators import Evaluator
 
 parser = argparse.ArgumentParser(
     prog="GA Experiment", description="performs genetic algorithm experiment"
@@ -51,9 +47,34 @@ parser.add_argument(
       tbl - TablePrinter
     """,
     type=str,
-    choices=("simple", "pp", "csv", "tbl"),
+    choices=PRINTERS,
     default="simple",
 )
+parser.add_argument(
+    "--cache-dir",
+    dest="cache_dir",
+    help="Directory to cache preprocessed cipher texts in [default: no cache]",
+    type=pathlib.Path,
+)
+parser.add_argument(
+    "--status-file",
+    dest="status_file",
+    help="File periodically rewritten with the live progress of the experiment (JSON)",
+    type=pathlib.Path,
+)
+parser.add_argument(
+    "--status-port",
+    dest="status_port",
+    help="Serve the live progress of the experiment (JSON) on this localhost port",
+    type=int,
+)
+parser.add_argument(
+    "--status-interval",
+    dest="status_interval",
+    help="Seconds between updates of the status file [default: 1.0]",
+    type=float,
+    default=1.0,
+)
 parser.add_argument(
     "-v",
     "--verbose",
@@ -64,64 +85,56 @@ parser.add_argument(
 )
 
 
-def mutation_algorithm(alg: str, random: Random) -> Mutation:
-    """selects the mutation algorithm to use
-    based on provided configuration value
-    """
-    if alg == "rc":
-        return RandomCharacterMutation(alleles=list(ALLELES), random=random)
-    else:
-        return ReciprocalExchangeMutation(random=random)
-
-
-def crossover_algorithm(alg: str, random: Random) -> Crossover:
-    """selects the crossover algorithm to use
-    based on provided configuration value
+@dataclass
+class Trial:
+    """state of a single run of the experiment,
+    kept between calls to `advance` so the run can be resumed
     """
-    if alg == "ox":
-        return OrderCrossover(random=random)
-    else:
-        return UniformCrossover(random=random)
 
-
-def selection_algorithm(alg: str, random: Random) -> Selection:
-    """selects the selection algorithm to use
-    based on provided configuration value
-    """
-    if alg.startswith("tour"):
-        k = int(alg.replace("tour", ""))
-        return TournamentSelection(k=k, random=random)
-    else:
-        return TournamentSelection(k=2, random=random)
-
-
-def output_printer(output_format: str, stream: TextIO = sys.stdout) -> Printer:
-    """selects the output formatting implementation
-    to display the results based on provided CLI option
-    """
-    if output_format == "pp":
-        return PrettyPrintPrinter(stream)
-    elif output_format == "csv":
-        return CsvPrinter(stream)
-    elif output_format == "tbl":
-        return TablePrinter(stream)
-    else:
-        return SimplePrinter(stream)
-
-
-def single_run(
-    run: int,
-    seed: int,
-    spec: dict,
-    config: dict,
-    rate: dict,
-    crossover_alg: str,
-    mutation_alg: str,
-    selection_alg: str,
-    text: str,
+    run: int
+    seed: int
+    spec: dict
+    config: dict
+    rate: dict
+    crossover_alg: str
+    mutation_alg: str
+    selection_alg: str
+    text: str | None  # cipher text, unless loaded from `tables`
+    tables: pathlib.Path | None  # location of cached cipher tables
+    rng: Random
+    population: list[str] | None = None
+    # exact fitness values known to the engine (see `genetic_algorithm`)
+    cache: dict[str, float] = field(default_factory=dict)
+    generation: int = 0  # number of generations completed
+    stats: RunStats = field(default_factory=RunStats)
+    best_fitness: float = math.inf  # best fitness of the latest generation
+    finished: bool = False
+
+    def fitness(self) -> "Evaluator":
+        """configured fitness function for the cipher text of the trial"""
+        if self.tables is not None:
+            tables = load(self.tables)
+        else:
+            tables = CipherTables.compute(self.text)
+        corpus = self.config.get("corpus")
+        if corpus is not None:
+            corpus = pathlib.Path(corpus).read_text()
+        return evaluator_algorithm(self.config.get("evaluator", "freq"), tables, corpus)
+
+
+def advance(
+    trial: Trial,
+    generations: int,
     verbose: bool,
-) -> list:
-    rng = Random(seed)
+    rung: int | None = None,
+    progress: Any | None = None,
+) -> tuple[Trial, list]:
+    """runs (or resumes) the trial for up to `generations` more generations.
+    Returns the updated trial along with the result rows of those generations.
+    Each generation is reported to the `progress` channel, if given.
+    """
+    spec, config, rate = trial.spec, trial.config, trial.rate
+    rng = trial.rng
     # construct parameters
     params = Parameters(
         chromosome_length=spec["key_length"],
@@ -129,63 +142,248 @@ def single_run(
         max_generation_span=config["max_gen"],
         crossover_rate=rate["crossover"],
         mutation_rate=rate["mutation"],
+        sample_fraction=config.get("sample_fraction", 1.0),
+        sample_ramp=config.get("sample_ramp", 0),
+        full_evaluations=config.get("full_evaluations", 2),
+        max_evaluations=config.get("max_evaluations"),
+        max_seconds=config.get("max_seconds"),
+        immigrants=config.get("immigrants"),
+        offspring=config.get("offspring", 2),
     )
 
-    crossover = crossover_algorithm(crossover_alg, random=rng)
-    mutation = mutation_algorithm(mutation_alg, random=rng)
-    selection = WithElitism(
-        selection_algorithm(selection_alg, random=rng),
-        random=rng,
-        n_elites=config["elites"],
+    # operators only hold on to the random generator,
+    # so they can be rebuilt each time the trial is resumed
+    crossover = crossover_algorithm(trial.crossover_alg, random=rng)
+    mutation = mutation_algorithm(trial.mutation_alg, random=rng)
+    selection = selection_algorithm(
+        trial.selection_alg, random=rng, n_elites=config["elites"]
     )
 
+    if trial.population is None:
+        trial.population = initpopulation(
+            params.initial_population_size, params.chromosome_length, random=rng
+        )
+
+    fitness = trial.fitness()
+
     # create genetic algorithm iterator
-    g = genetic_algorithm(
+    g = engine_algorithm(config.get("engine", "generational"))(
         params,
         crossover=crossover,
         mutation=mutation,
         selection=selection,
-        # use default fitness function
-        fitness=ExpectedCharFrequencyEvaluator(text),
+        fitness=fitness,
         rng=rng,
+        stats=trial.stats,
+        population=trial.population,
+        start_generation=trial.generation + 1,
+        cache=trial.cache,
     )
 
     results = []
     fitnesses = dict()
-    for gen, fitnesses in enumerate(g, 1):
+    duplicates, immigrants = trial.stats.duplicates, trial.stats.immigrants
+    for gen, fitnesses in enumerate(islice(g, generations), trial.generation + 1):
         best_solution, best_fit = max(fitnesses.items(), key=lambda tup: -tup[1])
         avg_fitness = sum(fitnesses.values()) / len(fitnesses.values())
         # add run result to result dataset
         results.append(
             (
-                run,
+                trial.run,
                 gen,
                 best_solution,
                 best_fit,
                 avg_fitness,
                 spec["file"],
-                seed,
+                trial.seed,
                 params,
-                crossover_alg,
-                mutation_alg,
-                selection_alg,
+                trial.crossover_alg,
+                trial.mutation_alg,
+                trial.selection_alg,
+                trial.stats.evaluations,
+                trial.stats.cache_hits,
+                trial.stats.evaluations_per_second,
+                rung,
+                # duplicates and immigrants of this generation
+                trial.stats.duplicates - duplicates,
+                trial.stats.immigrants - immigrants,
             )
         )
+        duplicates, immigrants = trial.stats.duplicates, trial.stats.immigrants
+        trial.generation = gen
+        trial.best_fitness = best_fit
+        report(progress, trial.run, gen, best_fit)
+
+    trial.finished = (
+        trial.generation >= params.max_generation_span
+        or trial.stats.exhausted(params)
+        or not results
+    )
+    report(progress, trial.run, trial.generation, trial.best_fitness, done=True)
 
     # display solution and decrypted cipher each run
-    if verbose:
+    if verbose and trial.finished and fitnesses:
         best_solution, best_fit = max(fitnesses.items(), key=lambda tup: -tup[1])
         print(
             dict(
                 solution=best_solution,
                 fitness=best_fit,
-                decrypted=decrypt(best_solution, text),
+                decrypted=decrypt_preprocessed(best_solution, fitness.tables.codes),
             ),
             end="\n\n",
         )
+    return trial, results
+
+
+def trials(config: dict, cache_dir: pathlib.Path | None = None) -> list[Trial]:
+    """all combinations of parameters in the experiment configuration
+
+    With a `cache_dir`, trials refer to the cached tables of their cipher text
+    (preprocessed once, then memory-mapped by the workers) instead of the text.
+    """
+    result = []
+    run = 1
+    for spec in config["runs"]:
+        with open(spec["file"]) as f:
+            text = f.read()
+        tables = cached(text, cache_dir) if cache_dir is not None else None
+
+        it = product(  # all combination of parameters
+            config["seeds"],
+            spec["crossover_algorithms"],
+            spec["mutation_algorithms"],
+            spec["selection_algorithms"],
+            spec["rates"],
+        )
+        for seed, crossover_alg, mutation_alg, selection_alg, rate in it:
+            result.append(
+                Trial(
+                    run=run,
+                    seed=seed,
+                    spec=spec,
+                    config=config,
+                    rate=rate,
+                    crossover_alg=crossover_alg,
+                    mutation_alg=mutation_alg,
+                    selection_alg=selection_alg,
+                    text=text if tables is None else None,
+                    tables=tables,
+                    rng=Random(seed),
+                )
+            )
+            run += 1
+    return result
+
+
+def run_rung(
+    executor: concurrent.futures.Executor,
+    trials: list[Trial],
+    budget: int,
+    verbose: bool,
+    rung: int | None = None,
+    progress: Any | None = None,
+) -> tuple[list[Trial], list]:
+    """advances every trial up to `budget` generations in parallel.
+    Returns the updated trials (in the same order) and their result rows
+    """
+    futures = [
+        executor.submit(
+            advance, trial, budget - trial.generation, verbose, rung, progress
+        )
+        for trial in trials
+    ]
+    results = []  # list of data points (per generation)
+    for future in progress_bar(
+        concurrent.futures.as_completed(futures),
+        total=len(futures),
+        ascii=True,
+        leave=False,
+    ):
+        results += future.result()[1]
+    return [future.result()[0] for future in futures], results
+
+
+def grid_search(
+    executor: concurrent.futures.Executor,
+    trials: list[Trial],
+    verbose: bool,
+    progress: Any | None = None,
+) -> list:
+    """runs every trial for the full number of generations"""
+    max_gen = trials[0].config["max_gen"] if trials else 0
+    _, results = run_rung(executor, trials, max_gen, verbose, progress=progress)
     return results
 
 
+def successive_halving(
+    executor: concurrent.futures.Executor,
+    trials: list[Trial],
+    verbose: bool,
+    min_gen: int,
+    eta: int,
+    progress: Any | None = None,
+) -> list:
+    """successive halving
+    starts every trial with a budget of `min_gen` generations,
+    then keeps only the best `1 / eta` of the trials of each run specification
+    (ranked by best fitness of their latest generation),
+    and resumes the survivors with `eta` times the budget,
+    until the survivors reach the maximum number of generations
+    """
+    if min_gen < 1 or eta < 2:
+        raise ValueError("successive halving requires min_gen >= 1 and eta >= 2")
+    max_gen = trials[0].config["max_gen"] if trials else 0
+    results = []
+    rung = 1
+    budget = min(min_gen, max_gen)
+    while trials:
+        trials, rows = run_rung(executor, trials, budget, verbose, rung, progress)
+        results += rows
+        trials = [trial for trial in trials if not trial.finished]
+        if budget >= max_gen:
+            break
+
+        # keep the best trials of each run specification
+        # (fitness values of different cipher texts are not comparable)
+        survivors = []
+        for _, group in groupby(trials, key=lambda trial: trial.spec):
+            group = sorted(group, key=lambda trial: trial.best_fitness)
+            survivors += group[: math.ceil(len(group) / eta)]
+        trials = sorted(survivors, key=lambda trial: trial.run)
+
+        budget = min(budget * eta, max_gen)
+        rung += 1
+    return results
+
+
+def planned_generations(trials: list[Trial], search: dict) -> int:
+    """total number of generations the experiment is expected to run
+    (fewer if runs stop early on their budgets)
+    """
+    if not trials:
+        return 0
+    max_gen = trials[0].config["max_gen"]
+    if search["mode"] != "halving":
+        return len(trials) * max_gen
+
+    min_gen, eta = search.get("min_gen", 10), search.get("eta", 2)
+    if min_gen < 1 or eta < 2:
+        # the budget would never grow to max_gen
+        raise ValueError("successive halving requires min_gen >= 1 and eta >= 2")
+
+    total = 0
+    for _, group in groupby(trials, key=lambda trial: trial.spec):
+        n, done = len(list(group)), 0
+        budget = min(min_gen, max_gen)
+        while True:
+            total += n * (budget - done)
+            if budget >= max_gen:
+                break
+            n, done = math.ceil(n / eta), budget
+            budget = min(budget * eta, max_gen)
+    return total
+
+
 def main() -> int:
     args = parser.parse_args()
 
@@ -194,57 +392,47 @@ def main() -> int:
 
     printer = output_printer(args.output_format, sys.stdout)
 
-    # compute number of steps required for experiment
-    # (for progress bar)
-    steps = sum(
-        len(config["seeds"])
-        * len(spec["rates"])
-        * len(spec["crossover_algorithms"])
-        * len(spec["mutation_algorithms"])
-        * len(spec["selection_algorithms"])
-        for spec in config["runs"]
-    )
+    if not 0.0 < config.get("sample_fraction", 1.0) <= 1.0:
+        parser.error(f"{args.config}: sample_fraction must be in (0, 1]")
+    search = config.get("search", {"mode": "grid"})
+    if search.get("mode") not in ("grid", "halving"):
+        parser.error(f"{args.config}: search mode must be 'grid' or 'halving'")
+    if search["mode"] == "halving":
+        if search.get("min_gen", 10) < 1:
+            parser.error(f"{args.config}: search min_gen must be at least 1")
+        if search.get("eta", 2) < 2:
+            parser.error(f"{args.config}: search eta must be at least 2")
+    experiment_trials = trials(config, args.cache_dir)
+
+    with contextlib.ExitStack() as stack:
+        progress = None
+        if args.status_file is not None or args.status_port is not None:
+            # channel for workers to report per-generation progress
+            progress = stack.enter_context(multiprocessing.Manager()).Queue()
+            stack.enter_context(
+                ProgressMonitor(
+                    progress,
+                    planned_generations(experiment_trials, search),
+                    status_file=args.status_file,
+                    port=args.status_port,
+                    interval=args.status_interval,
+                )
+            )
 
-    # with tqdm(total=steps, ascii=True, leave=False) as progress:
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        runs: dict[concurrent.futures.Future[list], int] = {}
-        run = 1
-        for spec in config["runs"]:
-            with open(spec["file"]) as f:
-                text = f.read()
-
-            it = product(  # all combination of parameters
-                config["seeds"],
-                spec["crossover_algorithms"],
-                spec["mutation_algorithms"],
-                spec["selection_algorithms"],
-                spec["rates"],
+        executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor())
+        if search["mode"] == "halving":
+            results = successive_halving(
+                executor,
+                experiment_trials,
+                args.verbose,
+                min_gen=search.get("min_gen", 10),
+                eta=search.get("eta", 2),
+                progress=progress,
+            )
+        else:
+            results = grid_search(
+                executor, experiment_trials, args.verbose, progress=progress
             )
-            for seed, crossover_alg, mutation_alg, selection_alg, rate in it:
-                future = executor.submit(
-                    single_run,
-                    run,
-                    seed,
-                    spec,
-                    config,
-                    rate,
-                    crossover_alg,
-                    mutation_alg,
-                    selection_alg,
-                    text,
-                    args.verbose,
-                )
-                runs[future] = run
-                run += 1
-
-        results = []  # list of data points (per generation)
-        for future in tqdm(
-            concurrent.futures.as_completed(runs.keys()),
-            total=steps,
-            ascii=True,
-            leave=False,
-        ):
-            results += future.result()
         # sorted by (run, gen)
         results = sorted(results, key=lambda result: (result[0], result[1]))
 
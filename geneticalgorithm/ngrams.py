@@ -0,0 +1,79 @@
+import functools
+import gzip
+import importlib.resources
+import math
+from array import array
+
+# n-gram evaluators that can be selected by name
+SIZES = {"bigram": 2, "trigram": 3, "quadgram": 4}
+
+# weight of the lower order estimate of n-grams that do not appear in the corpus
+BACKOFF = 0.4
+
+
+class NgramTable:
+    """log10-probabilities of every n-gram of letters,
+    stored in a dense table of 26^n entries indexed by the base-26 value
+    of the n-gram (e.g. "ab" -> 0 * 26 + 1)
+    """
+
+    def __init__(self, n: int, logprobs: array):
+        self.n = n
+        self.logprobs = logprobs
+
+    @classmethod
+    def from_corpus(cls, corpus: str, n: int) -> "NgramTable":
+        """estimates the n-gram probabilities from the letters of the corpus.
+        N-grams that do not appear in the corpus back off to the probability of
+        their first n-1 letters times the probability of their last letter
+        (scaled by `BACKOFF`), so rare but plausible n-grams still score
+        better than implausible ones. Letters that do not appear at all
+        get a small probability.
+        """
+        letters = [ord(c) - 97 for c in corpus.lower() if "a" <= c <= "z"]
+
+        unigrams = _logprobs(letters, 1, None, None)
+        logprobs = unigrams
+        for k in range(2, n + 1):
+            logprobs = _logprobs(letters, k, logprobs, unigrams)
+        return cls(n, logprobs)
+
+
+@functools.lru_cache(maxsize=8)
+def ngram_table(n: int, corpus: str | None = None) -> NgramTable:
+    """n-gram table of the corpus text (or the bundled english corpus),
+    built once per process
+    """
+    if corpus is None:
+        resource = importlib.resources.files(__package__) / "corpus" / "english.txt.gz"
+        corpus = gzip.decompress(resource.read_bytes()).decode()
+    return NgramTable.from_corpus(corpus, n)
+
+
+def _logprobs(
+    letters: list[int], k: int, lower: array | None, unigrams: array | None
+) -> array:
+    """log10-probabilities of the k-grams of the letters,
+    backing off to the (k-1)-gram table `lower` for unseen k-grams
+    """
+    size = 26**k
+    counts = [0] * size
+    index = 0
+    for i, c in enumerate(letters):
+        index = (index * 26 + c) % size
+        if i >= k - 1:
+            counts[index] += 1
+
+    total = max(sum(counts), 1)
+    if lower is None:
+        floor = math.log10(0.01 / total)
+        return array("d", (math.log10(c / total) if c else floor for c in counts))
+
+    backoff = math.log10(BACKOFF)
+    return array(
+        "d",
+        (
+            math.log10(c / total) if c else backoff + lower[i // 26] + unigrams[i % 26]
+            for i, c in enumerate(counts)
+        ),
+    )
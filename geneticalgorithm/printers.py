@@ -6,8 +6,27 @@ from typing import TextIO
 
 from . import Parameters
 
-# (run, generation, best solution, best fitness, average fitness, file, seed, parameters, crossover, mutation, selection)
-Row = tuple[int, int, str, float, float, str, int, Parameters, str, str, str]
+# (run, generation, best solution, best fitness, average fitness, file, seed, parameters, crossover, mutation, selection,
+#  evaluations, cache hits, evaluations/second, rung, duplicates, immigrants)
+Row = tuple[
+    int,
+    int,
+    str,
+    float,
+    float,
+    str,
+    int,
+    Parameters,
+    str,
+    str,
+    str,
+    int,
+    int,
+    float,
+    int | None,
+    int,
+    int,
+]
 
 
 class Printer(abc.ABC):
@@ -37,6 +56,12 @@ class PrettyPrintPrinter(Printer):
                 crossover=row[8],
                 mutation=row[9],
                 selection=row[10],
+                evaluations=row[11],
+                cache_hits=row[12],
+                evaluations_per_second=row[13],
+                rung=row[14],
+                duplicates=row[15],
+                immigrants=row[16],
             )
             pprint.pprint(obj, stream=self.stream)
 
@@ -44,6 +69,8 @@ class PrettyPrintPrinter(Printer):
 class CsvPrinter(Printer):
     def __init__(self, stream: TextIO | None = None):
         self.stream = stream or sys.stdout
+        # evaluations/second depends on the machine, so it is left out
+        # to keep the output of seeded experiments reproducible
         self.headers = [
             "Run",
             "Generation",
@@ -59,6 +86,11 @@ class CsvPrinter(Printer):
             "Best Solution",
             "Best Fitness",
             "Average Fitness",
+            "Evaluations",
+            "Cache Hits",
+            "Rung",
+            "Duplicates",
+            "Immigrants",
         ]
 
     def __call__(self, rows: list[Row]) -> None:
@@ -81,6 +113,11 @@ class CsvPrinter(Printer):
                 solution,
                 fitness,
                 avg_fit,
+                evaluations,
+                cache_hits,
+                rung,
+                duplicates,
+                immigrants,
             )
             for (
                 run,
@@ -94,6 +131,12 @@ class CsvPrinter(Printer):
                 crossover,
                 mutation,
                 selection,
+                evaluations,
+                cache_hits,
+                evals_per_sec,
+                rung,
+                duplicates,
+                immigrants,
             ) in rows
         ]
         self.writer.writerows(rows)
@@ -121,6 +164,12 @@ class TablePrinter(Printer):
             "Solution",
             "Fitness",
             "Average Fitness",
+            "Evaluations",
+            "Cache Hits",
+            "Evaluations/s",
+            "Rung",
+            "Duplicates",
+            "Immigrants",
         ]
 
     def _row(self, row: Row) -> tuple:
@@ -136,6 +185,12 @@ class TablePrinter(Printer):
             crossover,
             mutation,
             selection,
+            evaluations,
+            cache_hits,
+            evals_per_sec,
+            rung,
+            duplicates,
+            immigrants,
         ) = row
         return (
             run,
@@ -152,6 +207,12 @@ class TablePrinter(Printer):
             sol,
             fit,
             avgfit,
+            evaluations,
+            cache_hits,
+            evals_per_sec,
+            rung,
+            duplicates,
+            immigrants,
         )
 
     def __call__(self, rows: list[Row]) -> None:
@@ -0,0 +1,208 @@
+import collections
+import json
+import os
+import pathlib
+import queue
+import statistics
+import threading
+import time
+from typing import Any
+
+# number of recent updates used to estimate the throughput of a run
+WINDOW = 10
+
+
+def report(
+    channel: Any | None,
+    run: int,
+    generation: int,
+    best_fitness: float,
+    done: bool = False,
+):
+    """sends the progress of a run to the parent process
+    (no-op when progress is not being monitored)
+    """
+    if channel is None:
+        return
+    channel.put(
+        dict(
+            run=run,
+            generation=generation,
+            best_fitness=best_fitness,
+            worker=os.getpid(),
+            time=time.time(),
+            done=done,
+        )
+    )
+
+
+class ProgressMonitor:
+    """aggregates the progress reported by the workers of an experiment
+
+    Updates are read from `channel` (a queue shared with the workers) on a
+    background thread. The aggregated status is periodically written to
+    `status_file` (if given) and served as JSON over HTTP on
+    `localhost:port` (if given).
+    """
+
+    def __init__(
+        self,
+        channel: Any,
+        total_generations: int,
+        status_file: pathlib.Path | None = None,
+        port: int | None = None,
+        interval: float = 1.0,
+    ):
+        self.channel = channel
+        self.total_generations = total_generations
+        self.status_file = status_file
+        self.port = port
+        self.interval = interval
+
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.generations = 0
+        self.runs: dict[int, dict] = {}  # latest update of each run
+        # recent update times per run and per worker
+        self.history: dict[int, collections.deque] = {}
+        self.workers: dict[int, collections.deque] = {}
+
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._consume, daemon=True)
+        self.server = None
+
+    def start(self):
+        self.thread.start()
+        if self.port is not None:
+            import http.server
+
+            monitor = self
+
+            class Handler(http.server.BaseHTTPRequestHandler):
+                def do_GET(self):
+                    body = json.dumps(monitor.status(), indent=2).encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, *args):
+                    pass  # keep stderr quiet
+
+            self.server = http.server.ThreadingHTTPServer(
+                ("127.0.0.1", self.port), Handler
+            )
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        self._write()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _consume(self):
+        last_write = 0.0
+        while not self.stopped.is_set() or not self.channel.empty():
+            try:
+                update = self.channel.get(timeout=self.interval)
+            except queue.Empty:
+                update = None
+            if update is not None:
+                self._update(update)
+            if time.time() - last_write >= self.interval:
+                self._write()
+                last_write = time.time()
+
+    def _update(self, update: dict):
+        with self.lock:
+            run = update["run"]
+            if not update["done"]:
+                self.generations += 1
+                self.history.setdefault(run, collections.deque(maxlen=WINDOW))
+                self.history[run].append(update["time"])
+                self.workers.setdefault(
+                    update["worker"], collections.deque(maxlen=WINDOW)
+                )
+                self.workers[update["worker"]].append(update["time"])
+            else:
+                self.history.pop(run, None)  # rate restarts when resumed
+            self.runs[run] = update
+
+    def _write(self):
+        if self.status_file is None:
+            return
+        # write atomically, so readers never see a partial file
+        tmp = self.status_file.with_name(self.status_file.name + ".tmp")
+        tmp.write_text(json.dumps(self.status(), indent=2))
+        os.replace(tmp, self.status_file)
+
+    def status(self) -> dict:
+        """snapshot of the overall progress of the experiment"""
+        with self.lock:
+            now = time.time()
+            elapsed = now - self.started
+            rate = self.generations / elapsed if elapsed > 0 else 0.0
+            remaining = max(self.total_generations - self.generations, 0)
+
+            active = []
+            for run, update in sorted(self.runs.items()):
+                if update["done"]:
+                    continue
+                active.append(
+                    dict(
+                        run=run,
+                        generation=update["generation"],
+                        best_fitness=update["best_fitness"],
+                        worker=update["worker"],
+                        generations_per_second=_rate(self.history.get(run)),
+                        seconds_since_update=now - update["time"],
+                    )
+                )
+
+            # runs that are much slower than the typical active run
+            # (runs that just started or resumed have no measured rate yet)
+            measured = [r for r in active if r["generations_per_second"] is not None]
+            rates = [r["generations_per_second"] for r in measured]
+            typical = statistics.median(rates) if rates else 0.0
+            stragglers = [
+                r["run"]
+                for r in measured
+                if r["generations_per_second"] < 0.5 * typical
+                or (typical > 0 and r["seconds_since_update"] > 5 / typical)
+            ]
+
+            return dict(
+                elapsed_seconds=elapsed,
+                generations=self.generations,
+                total_generations=self.total_generations,
+                progress=self.generations / self.total_generations
+                if self.total_generations
+                else 1.0,
+                generations_per_second=rate,
+                eta_seconds=remaining / rate if rate > 0 else None,
+                active_runs=active,
+                workers={
+                    str(pid): dict(generations_per_second=_rate(times))
+                    for pid, times in sorted(self.workers.items())
+                },
+                stragglers=stragglers,
+            )
+
+
+def _rate(times: collections.deque | None) -> float | None:
+    """updates per second over the recent update times
+    (None until updates were received over some time)
+    """
+    if not times or len(times) < 2 or times[-1] <= times[0]:
+        return None
+    return (len(times) - 1) / (times[-1] - times[0])
@@ -0,0 +1,132 @@
+"""names of the algorithms that can be selected from the CLIs and experiment configurations
+
+Implementations are only imported once they are selected,
+so entry points do not pay for the modules they do not use.
+"""
+
+import functools
+import sys
+from random import Random
+from typing import TYPE_CHECKING, TextIO
+
+from . import ALLELES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .crossovers import Crossover
+    from .evaluators import Evaluator
+    from .mutations import Mutation
+    from .printers import Printer
+    from .selections import Selection
+    from .tables import CipherTables
+
+CROSSOVERS = ("ux", "ox")
+MUTATIONS = ("rx", "rc")
+SELECTIONS = ("tour2", "tour3", "tour4", "tour5")
+EVALUATORS = ("freq", "bigram", "trigram", "quadgram")
+PRINTERS = ("simple", "pp", "csv", "tbl")
+ENGINES = ("generational", "steady")
+
+
+def engine_algorithm(alg: str) -> "Callable":
+    """selects the genetic algorithm variant to run
+    based on provided CLI option or configuration value
+    """
+    from . import genetic_algorithm, steady_state_genetic_algorithm
+
+    if alg == "steady":
+        return steady_state_genetic_algorithm
+    else:
+        return genetic_algorithm
+
+
+def mutation_algorithm(alg: str, random: Random) -> "Mutation":
+    """selects the mutation algorithm to use
+    based on provided CLI option or configuration value
+    """
+    from . import mutations
+
+    if alg == "rc":
+        return mutations.RandomCharacterMutation(alleles=list(ALLELES), random=random)
+    else:
+        return mutations.ReciprocalExchangeMutation(random=random)
+
+
+def crossover_algorithm(alg: str, random: Random) -> "Crossover":
+    """selects the crossover algorithm to use
+    based on provided CLI option or configuration value
+    """
+    from . import crossovers
+
+    if alg == "ox":
+        return crossovers.OrderCrossover(random=random)
+    else:
+        return crossovers.UniformCrossover(random=random)
+
+
+def selection_algorithm(alg: str, random: Random, n_elites: int = 0) -> "Selection":
+    """selects the selection algorithm to use
+    based on provided CLI option or configuration value,
+    preserving `n_elites` elites each generation
+    """
+    from . import selections
+
+    if alg.startswith("tour"):
+        k = int(alg.replace("tour", ""))
+        selection = selections.TournamentSelection(k=k, random=random)
+    else:
+        selection = selections.TournamentSelection(k=2, random=random)
+    return selections.WithElitism(selection, random=random, n_elites=n_elites)
+
+
+def evaluator_algorithm(
+    alg: str, tables: "CipherTables", corpus: str | None = None
+) -> "Evaluator":
+    """selects the fitness function to use
+    based on provided CLI option or configuration value
+    (n-gram tables are estimated from the `corpus` text, if given)
+    """
+    from . import evaluators
+
+    if alg in ("bigram", "trigram", "quadgram"):
+        from .ngrams import SIZES, ngram_table
+
+        return evaluators.NgramLogLikelihoodEvaluator.from_tables(
+            tables, ngram_table(SIZES[alg], corpus)
+        )
+    else:
+        return evaluators.ExpectedCharFrequencyEvaluator.from_tables(tables)
+
+
+def output_printer(output_format: str, stream: TextIO = sys.stdout) -> "Printer":
+    """selects the output formatting implementation
+    to display the results based on provided CLI option
+    """
+    from . import printers
+
+    if output_format == "pp":
+        return printers.PrettyPrintPrinter(stream)
+    elif output_format == "csv":
+        return printers.CsvPrinter(stream)
+    elif output_format == "tbl":
+        return printers.TablePrinter(stream)
+    else:
+        return printers.SimplePrinter(stream)
+
+
+@functools.cache
+def _tqdm():
+    try:
+        from tqdm import tqdm
+
+        return tqdm
+    except ImportError:
+        print("To see progress bar, install tqdm package", file=sys.stderr)
+        return None
+
+
+def progress_bar(it, *args, **kwargs):
+    """wraps the iterable in a `tqdm` progress bar, if tqdm is installed"""
+    tqdm = _tqdm()
+    return tqdm(it, *args, **kwargs) if tqdm is not None else it
@@ -13,6 +13,12 @@ class Selection(abc.ABC):
     def __call__(self, population: list[str], fitness: Fitness) -> list[str]:
         pass
 
+    def select(self, population: list[str], fitness: Fitness, n: int) -> list[str]:
+        """selects only `n` chromosomes (e.g. parents for a steady-state GA)
+        instead of a whole new population
+        """
+        return self(population, fitness)[:n]
+
 
 class TournamentSelection(Selection):
     """implementation of tournament selection"""
@@ -30,6 +36,11 @@ class TournamentSelection(Selection):
             selections.append(selected)
         return selections
 
+    def select(self, population: list[str], fitness: Fitness, n: int) -> list[str]:
+        return [
+            max(self.random.sample(population, k=self.k), key=fitness) for _ in range(n)
+        ]
+
 
 class WithElitism(Selection):
     """elitism
@@ -55,3 +66,7 @@ class WithElitism(Selection):
             newpop[i] = elite
 
         return newpop
+
+    def select(self, population: list[str], fitness: Fitness, n: int) -> list[str]:
+        # elites only matter when replacing the whole population
+        return self.selection.select(population, fitness, n)
@@ -0,0 +1,201 @@
+import argparse
+import concurrent.futures
+import functools
+import json
+import os
+import pathlib
+import socketserver
+import sys
+from typing import Any
+
+from .__main__ import solve
+from .evaluators import Evaluator
+from .registry import evaluator_algorithm
+from .tables import CipherTables
+from .utils import decrypt_preprocessed, preprocess
+
+parser = argparse.ArgumentParser(
+    prog="GA Server",
+    description="serves genetic algorithm and decryption jobs from a pool of warm workers",
+)
+
+parser.add_argument(
+    "--unix",
+    dest="unix_socket",
+    help="Path of the unix domain socket to listen on [default: use TCP]",
+    type=pathlib.Path,
+)
+parser.add_argument(
+    "--host",
+    dest="host",
+    help="Host to listen on [default: 127.0.0.1]",
+    type=str,
+    default="127.0.0.1",
+)
+parser.add_argument(
+    "--port",
+    dest="port",
+    help="Port to listen on [default: 8765]",
+    type=int,
+    default=8765,
+)
+parser.add_argument(
+    "-j",
+    "--workers",
+    dest="workers",
+    help="Number of worker processes [default: number of CPUs]",
+    type=int,
+)
+
+# number of distinct cipher texts each worker keeps preprocessed
+CACHE_SIZE = 32
+
+# `geneticalgorithm` options naming files on the client's machine,
+# which the server does not read or write on behalf of clients
+LOCAL_OPTIONS = {
+    "cache_dir": "--cache-dir",
+    "checkpoint": "--checkpoint",
+    "resume": "--resume",
+    "init_population": "--init-population",
+}
+
+# `geneticalgorithm` options running several genetic algorithms in a job,
+# with their default (a job runs a single genetic algorithm on a server worker:
+# send one job per seed instead)
+RESTART_OPTIONS = {
+    "restarts": ("--restarts", 1),
+    "restart_workers": ("--restart-workers", None),
+}
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _evaluator(text: str, alg: str, corpus: str | None) -> Evaluator:
+    """evaluator for the cipher text, cached across requests"""
+    return evaluator_algorithm(alg, CipherTables.compute(text), corpus)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _codes(text: str) -> bytes:
+    """preprocessed cipher text, cached across requests"""
+    return preprocess(text)
+
+
+def job_options(args: argparse.Namespace) -> dict:
+    """options of a crack job (parsed `geneticalgorithm` CLI arguments)
+    in the form sent to the server: files are read by the client,
+    so the server never opens paths chosen by its clients
+    """
+    options = vars(args).copy()
+    options.pop("inputfile", None)
+    _check_options(options)
+    if options["corpus"] is not None:
+        options["corpus"] = options["corpus"].read_text()
+    return options
+
+
+def _check_options(options: dict):
+    for option, flag in LOCAL_OPTIONS.items():
+        if options.get(option) is not None:
+            raise ValueError(f"{flag} is not supported by the server")
+    for option, (flag, default) in RESTART_OPTIONS.items():
+        if options.get(option, default) != default:
+            raise ValueError(f"{flag} is not supported by the server")
+
+
+def crack(
+    args: dict, text: str, cancel: Any | None = None, progress: Any | None = None
+) -> dict:
+    """runs the genetic algorithm with the `geneticalgorithm` CLI options
+    as sent by `job_options` (see `solve` for `cancel` and `progress`)
+    """
+    _check_options(args)
+    fitness = _evaluator(text, args["evaluator"], args["corpus"])
+    solution, fitness, stats = solve(
+        argparse.Namespace(**args), fitness, cancel=cancel, progress=progress
+    )
+    return dict(
+        solution=solution,
+        fitness=fitness,
+        evaluations=stats.evaluations,
+        cache_hits=stats.cache_hits,
+        evaluations_per_second=stats.evaluations_per_second,
+        duplicates=stats.duplicates,
+        immigrants=stats.immigrants,
+    )
+
+
+def decrypt(args: dict, text: str) -> dict:
+    """decrypts the text with the `decrypt` CLI options"""
+    return dict(plain=decrypt_preprocessed(args["key"], _codes(text)))
+
+
+JOBS = {"crack": crack, "decrypt": decrypt}
+
+
+def _ping(_: int) -> int:
+    return os.getpid()
+
+
+class JobHandler(socketserver.StreamRequestHandler):
+    """handles newline-delimited JSON jobs of the form
+    `{"command": "crack" | "decrypt", "args": {...}, "text": "..."}`
+
+    each job is answered with a single JSON line containing
+    either `{"result": {...}}` or `{"error": "..."}`
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+                future = self.server.executor.submit(
+                    JOBS[job["command"]], job["args"], job["text"]
+                )
+                response = dict(result=future.result())
+            except Exception as e:
+                response = dict(error=f"{type(e).__name__}: {e}")
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def main() -> int:
+    args = parser.parse_args()
+
+    if args.unix_socket is not None:
+        args.unix_socket.unlink(missing_ok=True)  # remove stale socket
+        server = UnixServer(str(args.unix_socket), JobHandler)
+        address = args.unix_socket
+    else:
+        server = TCPServer((args.host, args.port), JobHandler)
+        address = "{}:{}".format(*server.server_address)
+
+    workers = args.workers or os.cpu_count() or 1
+    with server, concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        # start every worker up front so the first requests don't pay for it
+        list(executor.map(_ping, range(workers)))
+        server.executor = executor
+        print(f"Listening on {address}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if args.unix_socket is not None:
+                args.unix_socket.unlink(missing_ok=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
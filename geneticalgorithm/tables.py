@@ -0,0 +1,152 @@
+import functools
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+import shutil
+import tempfile
+from array import array
+
+from .utils import preprocess
+
+# longest key period with precomputed column tables
+MAX_PERIOD = 64
+
+# bumped whenever the on-disk layout changes
+VERSION = 1
+
+
+class CipherTables:
+    """preprocessed form of a cipher text, along with derived tables:
+
+    - `codes`: letter indices (0-25) of the cipher text (see `utils.preprocess`)
+    - per-period column letter counts: for a key period `p`, the counts of
+      each letter at the positions `r, r + p, r + 2p, ...` for each column `r`
+    - per-period index of coincidence (average over the columns)
+
+    Tables are either computed in memory (lazily, per period) or loaded
+    from a cache directory (see `cached`).
+    """
+
+    def __init__(
+        self,
+        codes: bytes | memoryview,
+        counts: memoryview | None = None,
+        ioc: memoryview | None = None,
+    ):
+        self.codes = codes
+        self._counts = counts  # precomputed counts for periods 1..MAX_PERIOD
+        self._ioc = ioc
+        self._columns: dict[int, list[list[int]]] = {}
+        self.path: pathlib.Path | None = None  # cache location, if memory-mapped
+
+    @classmethod
+    def compute(cls, text: str) -> "CipherTables":
+        return cls(preprocess(text))
+
+    def columns(self, period: int) -> list[list[int]]:
+        """letter counts (26 values) of each column for the key period"""
+        if period not in self._columns:
+            if self._counts is not None and period <= MAX_PERIOD:
+                offset = 26 * period * (period - 1) // 2
+                self._columns[period] = [
+                    self._counts[offset + 26 * r : offset + 26 * (r + 1)].tolist()
+                    for r in range(period)
+                ]
+            else:
+                self._columns[period] = [
+                    [column.count(y) for y in range(26)]
+                    for column in (bytes(self.codes[r::period]) for r in range(period))
+                ]
+        return self._columns[period]
+
+    def ioc(self, period: int) -> float:
+        """average index of coincidence of the columns for the key period"""
+        if self._ioc is not None and period <= MAX_PERIOD:
+            return self._ioc[period - 1]
+        return _ioc(self.columns(period))
+
+    def save(self, directory: pathlib.Path):
+        """writes the tables into `directory`, in a memory-mappable form"""
+        counts = array("I")
+        ioc = array("d")
+        for period in range(1, MAX_PERIOD + 1):
+            columns = self.columns(period)
+            for column in columns:
+                counts.extend(column)
+            ioc.append(_ioc(columns))
+
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "codes.bin").write_bytes(self.codes)
+        (directory / "counts.bin").write_bytes(counts.tobytes())
+        (directory / "ioc.bin").write_bytes(ioc.tobytes())
+        (directory / "meta.json").write_text(
+            json.dumps(dict(version=VERSION, length=len(self.codes)))
+        )
+
+    @classmethod
+    def open(cls, directory: pathlib.Path) -> "CipherTables":
+        """memory-maps the tables saved in `directory` (no copies are made)"""
+        tables = cls(
+            _mmap(directory / "codes.bin"),
+            counts=_mmap(directory / "counts.bin").cast("I"),
+            ioc=_mmap(directory / "ioc.bin").cast("d"),
+        )
+        tables.path = directory
+        return tables
+
+    def __reduce__(self):
+        # memory-mapped tables are sent to other processes by location,
+        # and mapped again on the other side
+        if self.path is not None:
+            return load, (self.path,)
+        return CipherTables, (self.codes,)
+
+
+def cache_path(text: str, cache_dir: pathlib.Path) -> pathlib.Path:
+    """content-addressed location of the tables of the text.
+    Any change to the text (or table layout) results in a new location
+    """
+    digest = hashlib.sha256(f"v{VERSION}\0{text}".encode()).hexdigest()
+    return cache_dir / digest
+
+
+def cached(text: str, cache_dir: pathlib.Path) -> pathlib.Path:
+    """returns the cache location of the tables of the text,
+    computing and saving them first if they are not in the cache yet
+    """
+    path = cache_path(text, cache_dir)
+    if not path.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # build in a temporary directory and rename,
+        # so concurrent readers never see a partial entry
+        tmp = pathlib.Path(tempfile.mkdtemp(dir=cache_dir))
+        CipherTables.compute(text).save(tmp)
+        try:
+            os.rename(tmp, path)
+        except OSError:
+            shutil.rmtree(tmp)  # created concurrently by another process
+    return path
+
+
+@functools.lru_cache(maxsize=32)
+def load(path: pathlib.Path) -> CipherTables:
+    """opens the cached tables, once per process"""
+    return CipherTables.open(path)
+
+
+def _mmap(path: pathlib.Path) -> memoryview:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _ioc(columns: list[list[int]]) -> float:
+    scores = []
+    for counts in columns:
+        n = sum(counts)
+        if n > 1:
+            scores.append(sum(c * (c - 1) for c in counts) / (n * (n - 1)))
+    return sum(scores) / len(scores) if scores else 0.0
@@ -1,31 +1,44 @@
-def decrypt(key: str, cipher: str) -> str:
-    """python implementation of decryption algorithm
-    provided in Evaluation.java
+def preprocess(cipher: str) -> bytes:
+    """normalizes the cipher text into letter indices (0-25)
+    exactly as the decryption algorithm interprets each character.
+
+    The result can be computed once and reused for every decryption
+    of the same cipher text.
     """
-    # sanitize cipher text and key
+    # sanitize cipher text
     cipher = cipher.lower()
     cipher = cipher.replace(r"[^a-z]", "")
     cipher = cipher.replace(r"\s", "")
-    cipher = [ord(c) for c in cipher]
+    return bytes((ord(c) - 97) % 26 for c in cipher)
 
+
+def key_shifts(key: str) -> list[int]:
+    """converts the key into the list of shifts used for decryption,
+    ignoring any character not in the expected range
+    """
+    # sanitize key
     key = key.lower()
     key = key.replace(r"[^a-z]", "")
     key = key.replace(r"\s", "")
-    key = [ord(c) - 97 for c in key]
+    return [k for k in (ord(c) - 97 for c in key) if 0 <= k <= 25]
 
-    # decrypt each character
-    plain = []
-    key_ptr = 0
-    for c in cipher:
-        key_char = 0
-        if len(key) > 0:
-            # ignore any value not in the expected range
-            while key[key_ptr] > 25 or key[key_ptr] < 0:
-                key_ptr = (key_ptr + 1) % len(key)
 
-            key_char = key[key_ptr]
-            key_ptr = (key_ptr + 1) % len(key)
+def decrypt_codes(key: str, codes: bytes) -> list[int]:
+    """decrypts a preprocessed cipher (see `preprocess`)
+    into the letter indices (0-25) of the plain text
+    """
+    shifts = key_shifts(key) or [0]
+    period = len(shifts)
+    return [(c - shifts[i % period]) % 26 for i, c in enumerate(codes)]
 
-        plain.append(chr((26 + c - 97 - key_char) % 26 + 97))
 
-    return "".join(i for i in plain)
+def decrypt_preprocessed(key: str, codes: bytes) -> str:
+    """decrypts a preprocessed cipher (see `preprocess`) into plain text"""
+    return "".join(chr(p + 97) for p in decrypt_codes(key, codes))
+
+
+def decrypt(key: str, cipher: str) -> str:
+    """python implementation of decryption algorithm
+    provided in Evaluation.java
+    """
+    return decrypt_preprocessed(key, preprocess(cipher))
@@ -0,0 +1,41 @@
+import asyncio
+import concurrent.futures
+import pathlib
+import threading
+
+import pytest
+
+from geneticalgorithm.aio import GARunner, options
+
+ROOT = pathlib.Path(__file__).parent.parent
+TEXT = (ROOT / "attachments" / "sample.txt").read_text()
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_exit_runner_with_unconsumed_stream(threads):
+    async def main() -> dict:
+        executor = concurrent.futures.ThreadPoolExecutor(1) if threads else None
+        async with GARunner(executor, buffer=2) as runner:
+            args = options(["26", "-s", "3", "-g", "50", "-p", "20"])
+            stream = runner.run(args, TEXT)
+            await asyncio.sleep(0.5)
+        if executor is not None:
+            executor.shutdown()
+        return await stream.result()
+
+    # a deadlocked shutdown would block asyncio.run too: run it in a daemon thread
+    future = concurrent.futures.Future()
+
+    def run():
+        try:
+            future.set_result(asyncio.run(main()))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    try:
+        result = future.result(timeout=30)
+    except concurrent.futures.TimeoutError:
+        pytest.fail("leaving the runner deadlocked")
+    # the job was stopped instead of waiting for its updates to be consumed
+    assert result["evaluations"] < 20 * 10
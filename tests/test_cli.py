@@ -0,0 +1,29 @@
+import pathlib
+import sys
+
+import pytest
+
+from geneticalgorithm import __main__ as ga
+
+ROOT = pathlib.Path(__file__).parent.parent
+SAMPLE = ROOT / "attachments" / "sample.txt"
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["--restarts", "0"], "--restarts must be at least 1"),
+        (["--restart-workers", "0"], "--restart-workers must be at least 1"),
+        (["--offspring", "0"], "--offspring must be at least 1"),
+        (["--sample-fraction", "0"], "--sample-fraction must be in (0, 1]"),
+        (["--sample-fraction", "1.5"], "--sample-fraction must be in (0, 1]"),
+    ],
+)
+def test_rejects_invalid_options(argv, message, monkeypatch, capsys):
+    monkeypatch.setattr(
+        sys, "argv", ["geneticalgorithm", "8", "-f", str(SAMPLE), *argv]
+    )
+    with pytest.raises(SystemExit) as e:
+        ga.main()
+    assert e.value.code == 2
+    assert message in capsys.readouterr().err
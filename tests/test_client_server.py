@@ -0,0 +1,74 @@
+import concurrent.futures
+import pathlib
+import sys
+import threading
+
+import pytest
+
+from geneticalgorithm import __main__ as ga
+from geneticalgorithm import client, server
+
+ROOT = pathlib.Path(__file__).parent.parent
+SAMPLE = ROOT / "attachments" / "sample.txt"
+CORPUS = ROOT / "README.md"
+
+
+def crack(argv, tmp_path, monkeypatch, capsys) -> tuple[int, str, str]:
+    """runs `ga-client crack <argv>` against a server on a unix socket"""
+    socket_path = tmp_path / "ga.sock"
+    srv = server.UnixServer(str(socket_path), server.JobHandler)
+    with srv, concurrent.futures.ThreadPoolExecutor(1) as executor:
+        srv.executor = executor
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        try:
+            monkeypatch.setattr(
+                sys, "argv", ["ga-client", "--unix", str(socket_path), "crack", *argv]
+            )
+            code = client.main()
+        finally:
+            srv.shutdown()
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+def check_rejected(argv, flag, tmp_path, monkeypatch, capsys):
+    """checks that both the client and the server reject the `flag` option"""
+    with pytest.raises(SystemExit) as e:
+        crack(argv, tmp_path, monkeypatch, capsys)
+    assert e.value.code == 2
+    assert f"{flag} is not supported by the server" in capsys.readouterr().err
+
+    # servers refuse them too, whatever the client
+    args = vars(ga.parser.parse_args(argv))
+    del args["inputfile"]
+    with pytest.raises(ValueError):
+        server.crack(args, SAMPLE.read_text())
+
+
+def test_crack_with_corpus(tmp_path, monkeypatch, capsys):
+    argv = ["8", "-f", str(SAMPLE), "-s", "3", "-g", "20", "-e", "bigram"]
+    argv += ["--corpus", str(CORPUS)]
+    # the server runs elsewhere: it must not depend on the client's paths
+    monkeypatch.chdir(tmp_path)
+    code, out, err = crack(argv, tmp_path, monkeypatch, capsys)
+    assert code == 0, err
+
+    monkeypatch.setattr(sys, "argv", ["geneticalgorithm", *argv])
+    assert ga.main() == 0
+    expected, _ = capsys.readouterr()
+    # same solution and fitness as the standalone CLI
+    assert out.splitlines()[:2] == expected.splitlines()[:2]
+
+
+@pytest.mark.parametrize(
+    "flag", ["--cache-dir", "--checkpoint", "--resume", "--init-population"]
+)
+def test_crack_rejects_local_paths(flag, tmp_path, monkeypatch, capsys):
+    argv = ["8", "-f", str(SAMPLE), flag, str(tmp_path / "path")]
+    check_rejected(argv, flag, tmp_path, monkeypatch, capsys)
+
+
+@pytest.mark.parametrize("flag", ["--restarts", "--restart-workers"])
+def test_crack_rejects_restarts(flag, tmp_path, monkeypatch, capsys):
+    argv = ["8", "-f", str(SAMPLE), flag, "5"]
+    check_rejected(argv, flag, tmp_path, monkeypatch, capsys)
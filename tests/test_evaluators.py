@@ -0,0 +1,27 @@
+import pathlib
+
+import pytest
+
+from geneticalgorithm import Parameters
+from geneticalgorithm.evaluators import NgramLogLikelihoodEvaluator
+from geneticalgorithm.ngrams import ngram_table
+from geneticalgorithm.tables import CipherTables
+
+ROOT = pathlib.Path(__file__).parent.parent
+SAMPLE = ROOT / "attachments" / "sample.txt"
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_subsample_keeps_one_ngram(n):
+    fitness = NgramLogLikelihoodEvaluator.from_tables(
+        CipherTables.compute(SAMPLE.read_text()), ngram_table(n)
+    )
+    sample = fitness.subsample(1e-6)
+    assert len(sample.tables.codes) == n
+    assert sample("password") > 0.0  # not a perfect score
+
+
+@pytest.mark.parametrize("fraction", [0.0, -0.5, 1.5, float("nan")])
+def test_parameters_reject_sample_fraction(fraction):
+    with pytest.raises(ValueError):
+        Parameters(8, 10, 10, 0.9, 0.1, sample_fraction=fraction)
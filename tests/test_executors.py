@@ -0,0 +1,46 @@
+import pathlib
+import sys
+
+import pytest
+
+from geneticalgorithm import __main__ as ga
+from geneticalgorithm.evaluators import NgramLogLikelihoodEvaluator
+from geneticalgorithm.executors import EvaluationExecutor
+from geneticalgorithm.ngrams import ngram_table
+from geneticalgorithm.tables import CipherTables
+
+ROOT = pathlib.Path(__file__).parent.parent
+DATA = ROOT / "attachments" / "Data1.txt"
+SAMPLE = ROOT / "attachments" / "sample.txt"
+
+
+def run(argv, monkeypatch, capsys) -> list[str]:
+    """solution, fitness, evaluations and cache hits reported by the CLI"""
+    monkeypatch.setattr(sys, "argv", ["geneticalgorithm", *argv])
+    assert ga.main() == 0
+    out, _ = capsys.readouterr()
+    return out.splitlines()[:4]  # the evaluation rate is not reproducible
+
+
+def test_map_matches_serial_evaluation():
+    fitness = NgramLogLikelihoodEvaluator.from_tables(
+        CipherTables.compute(DATA.read_text()), ngram_table(2, None)
+    )
+    chromosomes = ["abcdefghijklmnopqrstuvwxyz"[i:] + "a" * i for i in range(7)]
+    with EvaluationExecutor(fitness, workers=2) as executor:
+        assert executor.map(chromosomes) == [fitness(c) for c in chromosomes]
+        sample = fitness.subsample(0.3)
+        assert executor.map(chromosomes, 0.3) == [sample(c) for c in chromosomes]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["26", "-f", str(DATA), "-p", "40", "-e", "bigram", "--sample-fraction", "0.2"],
+        ["8", "-f", str(SAMPLE), "--engine", "steady"],
+    ],
+)
+def test_parallel_run_matches_serial_run(argv, monkeypatch, capsys):
+    argv = [*argv, "-s", "5", "-g", "15"]
+    expected = run(argv, monkeypatch, capsys)
+    assert run([*argv, "--eval-workers", "2"], monkeypatch, capsys) == expected
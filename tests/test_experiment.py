@@ -0,0 +1,24 @@
+import json
+import sys
+
+import pytest
+
+from geneticalgorithm import experiment
+
+
+@pytest.mark.parametrize(
+    "search, message",
+    [
+        ({"mode": "random"}, "search mode must be 'grid' or 'halving'"),
+        ({"mode": "halving", "min_gen": 0}, "search min_gen must be at least 1"),
+        ({"mode": "halving", "eta": 1}, "search eta must be at least 2"),
+    ],
+)
+def test_rejects_invalid_search(search, message, tmp_path, monkeypatch, capsys):
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps(dict(search=search, seeds=[1], runs=[])))
+    monkeypatch.setattr(sys, "argv", ["experiment", str(config)])
+    with pytest.raises(SystemExit) as e:
+        experiment.main()
+    assert e.value.code == 2
+    assert message in capsys.readouterr().err
@@ -0,0 +1,82 @@
+import pathlib
+import sys
+
+import pytest
+
+from geneticalgorithm import __main__ as ga
+from geneticalgorithm import experiment
+
+ROOT = pathlib.Path(__file__).parent.parent
+DATA = ROOT / "attachments" / "Data1.txt"
+SAMPLE = ROOT / "attachments" / "sample.txt"
+
+SAMPLING = ["26", "-f", str(DATA), "-p", "60", "-e", "bigram"]
+SAMPLING += ["--sample-fraction", "0.1", "--sample-ramp", "40"]
+STEADY = ["8", "-f", str(SAMPLE), "--engine", "steady"]
+
+
+def run(argv, monkeypatch, capsys) -> list[str]:
+    """solution, fitness, evaluations and cache hits reported by the CLI"""
+    monkeypatch.setattr(sys, "argv", ["geneticalgorithm", *argv])
+    assert ga.main() == 0
+    out, _ = capsys.readouterr()
+    return out.splitlines()[:4]  # the evaluation rate is not reproducible
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [*SAMPLING, "-s", "1"],
+        [*SAMPLING, "-s", "2"],
+        [*SAMPLING, "-s", "4"],
+        [*STEADY, "-s", "1"],
+    ],
+)
+def test_resume_matches_uninterrupted_run(argv, tmp_path, monkeypatch, capsys):
+    expected = run([*argv, "-g", "40"], monkeypatch, capsys)
+
+    checkpoint = str(tmp_path / "checkpoint")
+    run([*argv, "-g", "10", "--checkpoint", checkpoint], monkeypatch, capsys)
+    assert run([*argv, "-g", "40", "--resume", checkpoint], monkeypatch, capsys) == (
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        dict(sample_fraction=0.1, sample_ramp=40, evaluator="bigram"),
+        dict(engine="steady"),
+    ],
+)
+def test_advance_matches_uninterrupted_trial(config):
+    config = dict(
+        pop_size=60,
+        max_gen=40,
+        elites=2,
+        seeds=[1],
+        runs=[
+            dict(
+                file=str(DATA),
+                key_length=26,
+                crossover_algorithms=["ux"],
+                mutation_algorithms=["rc"],
+                selection_algorithms=["tour3"],
+                rates=[dict(crossover=0.9, mutation=0.5)],
+            )
+        ],
+        **config,
+    )
+
+    def rows(results):
+        # generation, best solution, best and average fitness,
+        # evaluations and cache hits (not the evaluation rate)
+        return [(r[1], r[2], r[3], r[4], r[11], r[12]) for r in results]
+
+    (trial,) = experiment.trials(config)
+    _, expected = experiment.advance(trial, 40, verbose=False)
+
+    (trial,) = experiment.trials(config)
+    trial, first = experiment.advance(trial, 10, verbose=False)
+    trial, second = experiment.advance(trial, 30, verbose=False)
+    assert rows(first + second) == rows(expected)